@@ -424,7 +424,6 @@ POLLING_REGISTER_KEYS = (
     REG_SUM_ALARM,
     REG_ALARMS_STATE,
     REG_HEAT_RECOVERY_EFFICIENCY,
-    REG_OVERPRESSURE_TIMER,
     REG_DEFROST_STATE,
     REG_SUPPLY_FAN_SPEED,
     REG_EXHAUST_FAN_SPEED,
@@ -8,6 +8,7 @@ import random
 import threading
 import time
 from datetime import timedelta
+from functools import cached_property
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
@@ -330,9 +331,14 @@ class ParmairCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         await self.hass.async_add_executor_job(_close)
 
-    @property
+    @cached_property
     def device_info(self) -> dict[str, Any]:
-        """Return device information."""
+        """Return device information.
+
+        Built from static registers (read once on the first poll), so it is computed once
+        and the same dict is shared by every entity. Options changes reload the entry and
+        create a new coordinator.
+        """
         sw_version = self.data.get("software_version")
         hw_type = self.data.get("hardware_type")
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
@@ -95,7 +96,31 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class ParmairSwitch(CoordinatorEntity[ParmairCoordinator], SwitchEntity):
+class _SerializedWriteMixin:
+    """Serialize an entity's register writes behind its _write_lock.
+
+    A call that repeats the most recently requested write while a write is still in
+    flight is dropped (double-clicks, automation retries); any other call waits its
+    turn, so a turn_off arriving during a turn_on is still applied afterwards.
+    """
+
+    coordinator: ParmairCoordinator
+    _write_lock: asyncio.Lock
+    _last_write: tuple[str, int] | None = None
+
+    async def _async_write(self, key: str, value: int) -> None:
+        """Write key=value and refresh, unless the same write is already pending."""
+        if self._write_lock.locked() and self._last_write == (key, value):
+            _LOGGER.debug("Dropping repeated write %s=%s (already in progress)", key, value)
+            return
+        self._last_write = (key, value)
+        async with self._write_lock:
+            _LOGGER.debug("Writing %s=%s", key, value)
+            await self.coordinator.async_write_register(key, value)
+            await self.coordinator.async_request_refresh()
+
+
+class ParmairSwitch(_SerializedWriteMixin, CoordinatorEntity[ParmairCoordinator], SwitchEntity):
     """Representation of a Parmair switch."""
 
     _attr_has_entity_name = True
@@ -118,6 +143,8 @@ class ParmairSwitch(CoordinatorEntity[ParmairCoordinator], SwitchEntity):
         self._attr_device_info = coordinator.device_info
         self._attr_device_class = SwitchDeviceClass.SWITCH
         self._attr_entity_registry_enabled_default = True
+        # Serializes turn_on/turn_off writes (see _SerializedWriteMixin)
+        self._write_lock = asyncio.Lock()
 
     @property
     def is_on(self) -> bool | None:
@@ -146,24 +173,16 @@ class ParmairSwitch(CoordinatorEntity[ParmairCoordinator], SwitchEntity):
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the switch on."""
-        try:
-            await self.coordinator.async_write_register(self._data_key, 1)
-            await self.coordinator.async_request_refresh()
-        except Exception as ex:
-            _LOGGER.error("Failed to turn on %s: %s", self._data_key, ex)
-            raise
+        await self._async_write(self._data_key, 1)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the switch off."""
-        try:
-            await self.coordinator.async_write_register(self._data_key, 0)
-            await self.coordinator.async_request_refresh()
-        except Exception as ex:
-            _LOGGER.error("Failed to turn off %s: %s", self._data_key, ex)
-            raise
+        await self._async_write(self._data_key, 0)
 
 
-class ParmairBoostSwitch(CoordinatorEntity[ParmairCoordinator], SwitchEntity):
+class ParmairBoostSwitch(
+    _SerializedWriteMixin, CoordinatorEntity[ParmairCoordinator], SwitchEntity
+):
     """Representation of a Parmair boost mode switch."""
 
     _attr_has_entity_name = True
@@ -184,6 +203,8 @@ class ParmairBoostSwitch(CoordinatorEntity[ParmairCoordinator], SwitchEntity):
         self._attr_device_info = coordinator.device_info
         self._attr_device_class = SwitchDeviceClass.SWITCH
         self._attr_entity_registry_enabled_default = True
+        # Serializes turn_on/turn_off writes (see _SerializedWriteMixin)
+        self._write_lock = asyncio.Lock()
 
     @property
     def is_on(self) -> bool | None:
@@ -227,24 +248,16 @@ class ParmairBoostSwitch(CoordinatorEntity[ParmairCoordinator], SwitchEntity):
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Activate boost mode."""
-        try:
-            await self.coordinator.async_write_register(REG_CONTROL_STATE, 3)
-            await self.coordinator.async_request_refresh()
-        except Exception as ex:
-            _LOGGER.error("Failed to activate boost mode: %s", ex)
-            raise
+        await self._async_write(REG_CONTROL_STATE, 3)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Deactivate boost mode (return to home mode)."""
-        try:
-            await self.coordinator.async_write_register(REG_CONTROL_STATE, 2)
-            await self.coordinator.async_request_refresh()
-        except Exception as ex:
-            _LOGGER.error("Failed to deactivate boost mode: %s", ex)
-            raise
+        await self._async_write(REG_CONTROL_STATE, 2)
 
 
-class ParmairOverpressureSwitch(CoordinatorEntity[ParmairCoordinator], SwitchEntity):
+class ParmairOverpressureSwitch(
+    _SerializedWriteMixin, CoordinatorEntity[ParmairCoordinator], SwitchEntity
+):
     """Representation of a Parmair overpressure mode switch."""
 
     _attr_has_entity_name = True
@@ -265,6 +278,8 @@ class ParmairOverpressureSwitch(CoordinatorEntity[ParmairCoordinator], SwitchEnt
         self._attr_device_info = coordinator.device_info
         self._attr_device_class = SwitchDeviceClass.SWITCH
         self._attr_entity_registry_enabled_default = True
+        # Serializes turn_on/turn_off writes (see _SerializedWriteMixin)
+        self._write_lock = asyncio.Lock()
 
     @property
     def is_on(self) -> bool | None:
@@ -301,18 +316,8 @@ class ParmairOverpressureSwitch(CoordinatorEntity[ParmairCoordinator], SwitchEnt
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Activate overpressure mode."""
-        try:
-            await self.coordinator.async_write_register(REG_CONTROL_STATE, 4)
-            await self.coordinator.async_request_refresh()
-        except Exception as ex:
-            _LOGGER.error("Failed to activate overpressure mode: %s", ex)
-            raise
+        await self._async_write(REG_CONTROL_STATE, 4)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Deactivate overpressure mode (return to home mode)."""
-        try:
-            await self.coordinator.async_write_register(REG_CONTROL_STATE, 2)
-            await self.coordinator.async_request_refresh()
-        except Exception as ex:
-            _LOGGER.error("Failed to deactivate overpressure mode: %s", ex)
-            raise
+        await self._async_write(REG_CONTROL_STATE, 2)
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import sys
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 import pytest
@@ -16,8 +19,14 @@ sys.path.insert(0, str(PROJECT_ROOT / "tools"))
 
 from tools.mock_coordinator import MockCoordinator, load_dump  # noqa: E402
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson comes with Home Assistant; stdlib is the fallback
+    _json_loads = json.loads
+
 # Path to test fixtures
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
+MAC120_V2_FIXTURE = FIXTURES_DIR / "MAC120-full-v2.json"
 
 
 def discover_fixture_files() -> list[Path]:
@@ -27,78 +36,145 @@ def discover_fixture_files() -> list[Path]:
     return sorted(FIXTURES_DIR.glob("*.json"))
 
 
-def get_fixture_ids() -> list[str]:
+def get_fixture_ids(files: list[Path] | None = None) -> list[str]:
     """Get human-readable IDs for fixture files."""
-    return [f.stem for f in discover_fixture_files()]
+    return [f.stem for f in (discover_fixture_files() if files is None else files)]
 
 
-# Parametrize helper for fixture files
+# Parametrize helper for fixture files (globbed once at import)
 FIXTURE_FILES = discover_fixture_files()
-FIXTURE_IDS = get_fixture_ids()
-
-
-@pytest.fixture(params=FIXTURE_FILES, ids=FIXTURE_IDS)
+FIXTURE_IDS = get_fixture_ids(FIXTURE_FILES)
+# Under pytest-xdist (-n auto --dist loadgroup) keep all tests for one fixture file on one
+# worker so the session-scoped coordinator is loaded once per file
+FIXTURE_PARAMS = [
+    pytest.param(path, id=fixture_id, marks=pytest.mark.xdist_group(name=fixture_id))
+    for path, fixture_id in zip(FIXTURE_FILES, FIXTURE_IDS, strict=True)
+]
+
+
+# Session scope: each fixture file is loaded once and shared by every test that uses it.
+# Tests must treat these objects as read-only.
+@pytest.fixture(scope="session", params=FIXTURE_PARAMS)
 def fixture_file(request: pytest.FixtureRequest) -> Path:
     """Parametrized fixture that yields each fixture file path."""
     return request.param
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def coordinator(fixture_file: Path) -> MockCoordinator:
     """Create a MockCoordinator from a fixture file."""
     return load_dump(fixture_file)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def coord_data(coordinator: MockCoordinator) -> Mapping[str, Any]:
+    """Read-only snapshot of the coordinator's scaled register data.
+
+    Shared by every test for the session, so it is wrapped to make accidental
+    mutation fail loudly instead of leaking into later tests.
+    """
+    return MappingProxyType(dict(coordinator.data))
+
+
+@pytest.fixture(scope="session")
+def data_keys(coordinator: MockCoordinator) -> frozenset[str]:
+    """Keys present in the coordinator's data, for cheap presence checks."""
+    return frozenset(coordinator.data)
+
+
+@pytest.fixture(scope="session")
+def coord_raw(coordinator: MockCoordinator) -> Mapping[str, int | None]:
+    """Read-only raw (unscaled) register values keyed like coordinator.data."""
+    return MappingProxyType(
+        {key: coordinator.get_raw_value(key) for key in coordinator.raw_registers}
+    )
+
+
+# Optional sensors, and the raw values they report when not installed (0xFFFF = 65535)
+OPTIONAL_SENSORS = ("humidity", "co2")
+_NOT_INSTALLED: frozenset[int] = frozenset({0, -1, 65535})
+
+
+@pytest.fixture(scope="session")
+def installed_sensors(coord_raw: Mapping[str, int | None]) -> Mapping[str, bool]:
+    """Whether each optional sensor is installed, computed once per fixture file."""
+    return MappingProxyType(
+        {sensor: coord_raw.get(sensor) not in _NOT_INSTALLED for sensor in OPTIONAL_SENSORS}
+    )
+
+
+# Process-lifetime cache: each pytest run (and each xdist worker) parses a file at most once
+@functools.cache
+def _load_fixture(path: str) -> dict[str, Any]:
+    """Parse a fixture file's JSON."""
+    return _json_loads(Path(path).read_bytes())
+
+
+@pytest.fixture(scope="session")
 def fixture_data(fixture_file: Path) -> dict[str, Any]:
-    """Load raw fixture data as a dictionary."""
-    with open(fixture_file, encoding="utf-8") as f:
-        return json.load(f)
+    """Load raw fixture data as a dictionary (shared; treat as read-only)."""
+    return _load_fixture(str(fixture_file))
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def fixture_metadata(fixture_data: dict[str, Any]) -> dict[str, Any]:
     """Extract metadata from fixture data."""
     return fixture_data.get("metadata", {})
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def fixture_registers(fixture_data: dict[str, Any]) -> dict[str, Any]:
     """Extract registers from fixture data."""
     return fixture_data.get("registers", {})
 
 
 # Single coordinator fixtures for specific machine types (useful for targeted tests)
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mac120_v2_coordinator() -> MockCoordinator | None:
     """Load the MAC120 V2 fixture if available."""
-    fixture_path = FIXTURES_DIR / "MAC120-full-v2.json"
-    if fixture_path.exists():
-        return load_dump(fixture_path)
+    if MAC120_V2_FIXTURE.exists():
+        return load_dump(MAC120_V2_FIXTURE)
     pytest.skip("MAC120-full-v2.json fixture not available")
     return None
 
 
-# Helper fixtures for version detection
-@pytest.fixture
-def is_v2_device(coordinator: MockCoordinator) -> bool:
-    """Check if the current fixture is a V2.x device."""
-    sw_ver = coordinator.data.get("software_version", 0)
-    return sw_ver >= 2.0 if isinstance(sw_ver, int | float) else False
+def _version_mismatch(item: pytest.Item) -> bool:
+    """Return True if a v1_only/v2_only test is parametrized with the other version's fixture."""
+    v1_only = item.get_closest_marker("v1_only") is not None
+    v2_only = item.get_closest_marker("v2_only") is not None
+    callspec = getattr(item, "callspec", None)
+    if not (v1_only or v2_only) or callspec is None or "fixture_file" not in callspec.params:
+        return False
+    try:
+        is_v2 = load_dump(callspec.params["fixture_file"]).is_v2
+    except (OSError, ValueError):  # Unreadable file or invalid JSON (JSONDecodeError)
+        # Keep the test; the broken fixture then fails at setup with the same load error
+        return False
+    return (v2_only and not is_v2) or (v1_only and is_v2)
 
 
 # Collect all fixture files at module load time for test discovery
-def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:  # noqa: ARG001
-    """Skip tests if no fixture files are available."""
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Skip tests if no fixture files are available; deselect version-mismatched tests."""
     if not FIXTURE_FILES:
         skip_marker = pytest.mark.skip(reason="No fixture files found in tests/fixtures/")
         for item in items:
             # Skip parametrized tests that depend on fixtures
             if "fixture_file" in item.fixturenames or "coordinator" in item.fixturenames:
                 item.add_marker(skip_marker)
+        return
+
+    # Drop v1_only/v2_only tests for fixtures of the other version at collection time,
+    # so they never set up fixtures just to be skipped
+    deselected = [item for item in items if _version_mismatch(item)]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = [item for item in items if item not in deselected]
 
 
 def pytest_configure(config: pytest.Config) -> None:
     """Register custom markers."""
     config.addinivalue_line("markers", "v1_only: mark test to run only on V1.x devices")
     config.addinivalue_line("markers", "v2_only: mark test to run only on V2.x devices")
+    # Registered here too so runs without pytest-xdist don't warn about an unknown marker
+    config.addinivalue_line("markers", "xdist_group(name): run grouped tests on one xdist worker")
@@ -0,0 +1,74 @@
+"""Tests for block scanning in tools/discover_registers.py, using a fake Modbus client."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+from pymodbus.exceptions import ModbusIOException
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from tools.discover_registers import scan_block  # noqa: E402
+
+
+class _Response:
+    """Minimal pymodbus read response."""
+
+    def __init__(self, registers: list[int] | None = None):
+        self.registers = registers or []
+        self._error = registers is None
+
+    def isError(self) -> bool:
+        return self._error
+
+
+class FakeModbusClient:
+    """Serves address-derived values; requests covering an address in bad fail.
+
+    With raise_on_bad the failure is an exception (timeout, I/O error) instead of
+    an error response.
+    """
+
+    def __init__(self, bad: frozenset[int] = frozenset(), raise_on_bad: bool = False):
+        self.bad = bad
+        self.raise_on_bad = raise_on_bad
+        self.requests: list[tuple[int, int]] = []
+
+    def read_holding_registers(self, address: int, count: int = 1, **kwargs) -> _Response:
+        self.requests.append((address, count))
+        addresses = range(address, address + count)
+        if self.bad.intersection(addresses):
+            if self.raise_on_bad:
+                raise ModbusIOException("no response")
+            return _Response()
+        return _Response([a - 1000 for a in addresses])
+
+
+class TestScanBlock:
+    """Reading a block and bisecting around unreadable addresses."""
+
+    def test_readable_block_uses_one_request(self):
+        """A block with no bad addresses is read in a single request."""
+        client = FakeModbusClient()
+        assert list(scan_block(client, 1000, 8, slave_id=1)) == [
+            (a, a - 1000) for a in range(1000, 1008)
+        ]
+        assert client.requests == [(1000, 8)]
+
+    def test_bisects_down_to_the_bad_address(self):
+        """Only the unreadable address is missing from the results."""
+        client = FakeModbusClient(bad=frozenset({1005}))
+        found = dict(scan_block(client, 1000, 8, slave_id=1))
+        assert sorted(found) == [a for a in range(1000, 1008) if a != 1005]
+        assert (1005, 1) in client.requests
+        # Bisection, not a per-address rescan of the whole block
+        assert len(client.requests) < 8
+
+    def test_exception_bisects_like_an_error_response(self):
+        """A read that raises is split the same way instead of aborting the scan."""
+        client = FakeModbusClient(bad=frozenset({1002}), raise_on_bad=True)
+        found = dict(scan_block(client, 1000, 4, slave_id=1))
+        assert sorted(found) == [1000, 1001, 1003]
@@ -0,0 +1,191 @@
+"""Tests for the span reads in tools/dump_registers.py, using a fake Modbus client."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+from pymodbus.exceptions import ModbusIOException
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from tools import dump_registers  # noqa: E402
+from tools.dump_registers import MAX_SPAN, Pacer, build_read_spans, read_spans  # noqa: E402
+
+
+class _Response:
+    """Minimal pymodbus read response."""
+
+    def __init__(self, registers: list[int] | None = None):
+        self.registers = registers or []
+        self._error = registers is None
+
+    def isError(self) -> bool:
+        return self._error
+
+
+class FakeModbusClient:
+    """Serves register values; any request that covers an address in bad fails.
+
+    With raise_on_bad the failure is an exception (timeout, I/O error) instead of
+    an error response.
+    """
+
+    def __init__(
+        self,
+        values: dict[int, int],
+        bad: frozenset[int] = frozenset(),
+        raise_on_bad: bool = False,
+    ):
+        self.values = values
+        self.bad = bad
+        self.raise_on_bad = raise_on_bad
+        self.requests: list[tuple[int, int]] = []
+
+    def read_holding_registers(self, address: int, count: int = 1, **kwargs) -> _Response:
+        self.requests.append((address, count))
+        addresses = range(address, address + count)
+        if self.bad.intersection(addresses):
+            if self.raise_on_bad:
+                raise ModbusIOException("no response")
+            return _Response()
+        return _Response([self.values.get(a, 0) for a in addresses])
+
+
+class _NoWaitPacer:
+    """Pacer stand-in that never sleeps."""
+
+    def wait(self) -> None:
+        pass
+
+
+@pytest.fixture(autouse=True)
+def _no_retry_delay(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Skip the delay between read retries."""
+    monkeypatch.setattr(dump_registers.time, "sleep", lambda _seconds: None)
+
+
+class TestBuildReadSpans:
+    """Grouping register addresses into read spans."""
+
+    def test_consecutive_addresses_form_one_span(self):
+        """Unsorted, duplicated consecutive addresses become one span."""
+        assert build_read_spans([1002, 1000, 1001, 1001]) == [(1000, 3)]
+
+    def test_gap_starts_new_span(self):
+        """A missing address splits the span."""
+        assert build_read_spans([1000, 1001, 1003, 1004, 1010]) == [
+            (1000, 2),
+            (1003, 2),
+            (1010, 1),
+        ]
+
+    def test_span_split_at_max_span(self):
+        """Consecutive runs longer than MAX_SPAN are split."""
+        spans = build_read_spans(range(1000, 1000 + MAX_SPAN + 5))
+        assert spans == [(1000, MAX_SPAN), (1000 + MAX_SPAN, 5)]
+
+    def test_empty(self):
+        """No addresses, no spans."""
+        assert build_read_spans([]) == []
+
+
+class TestReadSpans:
+    """Reading spans with the single-register fallback."""
+
+    def test_span_read_in_one_request(self):
+        """A readable span is fetched with a single request."""
+        client = FakeModbusClient({1000: 1, 1001: 2, 1002: 65535})
+        values = read_spans(client, [(1000, 3)], slave_id=1, pacer=_NoWaitPacer())
+        assert values == {1000: 1, 1001: 2, 1002: -1}
+        assert client.requests == [(1000, 3)]
+
+    def test_failed_span_falls_back_to_single_reads(self):
+        """A span that keeps failing is re-read singly, losing only the bad address."""
+        client = FakeModbusClient({1000: 10, 1001: 11, 1002: 12}, bad=frozenset({1001}))
+        values = read_spans(client, [(1000, 3)], slave_id=1, pacer=_NoWaitPacer())
+        assert values == {1000: 10, 1002: 12}
+        # The whole span is retried before falling back to one request per address
+        span_attempts = [req for req in client.requests if req == (1000, 3)]
+        assert len(span_attempts) == 3
+        assert (1000, 1) in client.requests
+        assert (1002, 1) in client.requests
+
+    def test_raising_span_falls_back_to_single_reads(self):
+        """A span whose read raises is handled like an error response, not aborting the dump."""
+        client = FakeModbusClient(
+            {1000: 10, 1001: 11, 1002: 12}, bad=frozenset({1001}), raise_on_bad=True
+        )
+        values = read_spans(client, [(1000, 3)], slave_id=1, pacer=_NoWaitPacer())
+        assert values == {1000: 10, 1002: 12}
+
+
+class _FakeClock:
+    """Stands in for time.monotonic/time.sleep; sleeping advances the clock."""
+
+    def __init__(self, now: float = 100.0):
+        self.now = now
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestPacer:
+    """Spacing of request starts."""
+
+    @pytest.fixture
+    def clock(self, monkeypatch: pytest.MonkeyPatch) -> _FakeClock:
+        clock = _FakeClock()
+        monkeypatch.setattr(dump_registers.time, "monotonic", clock.monotonic)
+        monkeypatch.setattr(dump_registers.time, "sleep", clock.sleep)
+        return clock
+
+    def test_first_wait_does_not_sleep(self, clock: _FakeClock):
+        """The first request goes out immediately."""
+        Pacer(0.25).wait()
+        assert clock.sleeps == []
+
+    def test_back_to_back_requests_are_spaced(self, clock: _FakeClock):
+        """A request right after the previous one waits out the interval."""
+        pacer = Pacer(0.25)
+        pacer.wait()
+        clock.now += 0.05  # Request took 50 ms
+        pacer.wait()
+        assert clock.sleeps == [pytest.approx(0.2)]
+
+    def test_slow_request_is_not_followed_by_a_sleep(self, clock: _FakeClock):
+        """Time spent in a slow request counts towards the interval."""
+        pacer = Pacer(0.25)
+        pacer.wait()
+        clock.now += 0.4  # Request took longer than the interval
+        pacer.wait()
+        assert clock.sleeps == []
+
+
+class _UnreachableClient:
+    """ModbusTcpClient stand-in whose connection always fails."""
+
+    connected = False
+
+    def __init__(self, **kwargs):
+        pass
+
+    def connect(self) -> bool:
+        return False
+
+
+def test_failed_connect_leaves_no_jsonl_file(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    """The JSON Lines file is only created once the device is connected."""
+    monkeypatch.setattr(dump_registers, "ModbusTcpClient", _UnreachableClient)
+    output = tmp_path / "dump.jsonl"
+    with pytest.raises(dump_registers.ModbusException):
+        dump_registers.dump_device("192.0.2.1", jsonl_path=output)
+    assert not output.exists()
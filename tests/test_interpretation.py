@@ -9,6 +9,8 @@ from __future__ import annotations
 
 import re
 import sys
+from collections.abc import Mapping
+from math import isclose
 from pathlib import Path
 from typing import Any
 
@@ -20,8 +22,8 @@ sys.path.insert(0, str(PROJECT_ROOT))
 sys.path.insert(0, str(PROJECT_ROOT / "tools"))
 
 from custom_components.parmair.const import (  # noqa: E402
-    FILTER_STATE_MAP_V1,
     FILTER_STATE_MAP_V2,
+    POLLING_REGISTER_KEYS,
     SOFTWARE_VERSION_2,
 )
 from tools.mock_coordinator import (  # noqa: E402
@@ -33,6 +35,52 @@ from tools.mock_coordinator import (  # noqa: E402
     load_dump,
 )
 
+_MAC_MODEL_RE = re.compile(r"^MAC \d+$")
+
+_NUMERIC = (int, float)
+
+
+def _check_range(name: str, value: Any, low: float, high: float) -> None:
+    """Assert that value is a number within [low, high]."""
+    assert isinstance(value, _NUMERIC) and low <= value <= high, (
+        f"{name}={value} out of valid range [{low}, {high}]"
+    )
+
+
+# (key, low, high, required): physically reasonable bounds for scaled values.
+# Optional keys skip when absent from the fixture; required keys fail.
+RANGE_CHECKS: list[tuple[str, float, float, bool]] = [
+    ("software_version", 0.5, 10.0, True),
+    # Valid MAC models: 80, 100, 120, 150, etc.
+    ("hardware_type", 50, 500, True),
+    # Allow -50°C to +80°C range for ventilation systems
+    ("fresh_air_temp", -50, 80, False),
+    ("supply_after_recovery_temp", -50, 80, False),
+    ("supply_temp", -50, 80, False),
+    ("exhaust_temp", -50, 80, False),
+    ("waste_temp", -50, 80, False),
+    # Setpoints typically 10°C to 30°C
+    ("exhaust_temp_setpoint", 5, 35, False),
+    ("supply_temp_setpoint", 5, 35, False),
+    # Speed typically 0-5 or similar
+    ("actual_speed", 0, 10, False),
+    ("supply_fan_speed", 0, 100, False),
+    ("exhaust_fan_speed", 0, 100, False),
+    # Preset speeds typically 1-5
+    ("home_speed", 0, 10, False),
+    ("away_speed", 0, 10, False),
+    ("boost_setting", 0, 10, False),
+    ("humidity", 0, 100, False),
+    # CO2 typically 400-5000 ppm in ventilation scenarios
+    ("co2", 200, 10000, False),
+    # V2: 0=3 months, 1=4 months, 2=6 months
+    ("filter_interval", 0, 10, False),
+    ("heat_recovery_efficiency", 0, 100, False),
+    ("post_heater_output", 0, 100, False),
+    ("pre_heater_output", 0, 100, False),
+    ("heat_recovery_output", 0, 100, False),
+]
+
 
 class TestFixtureLoading:
     """Test that fixture files load correctly."""
@@ -54,24 +102,14 @@ class TestFixtureLoading:
         """Verify fixture has register data."""
         assert len(fixture_registers) > 0
 
+    def test_load_dump_is_cached(self, fixture_file: Path) -> None:
+        """Loading the same unchanged file twice should reuse the parsed coordinator."""
+        assert load_dump(fixture_file) is load_dump(str(fixture_file))
+
 
 class TestSystemInfo:
     """Test system information interpretation."""
 
-    def test_software_version_present(self, coordinator: MockCoordinator) -> None:
-        """Software version should be present and valid."""
-        sw_ver = coordinator.data.get("software_version")
-        assert sw_ver is not None, "Software version should be present"
-        assert isinstance(sw_ver, int | float), "Software version should be numeric"
-        assert 0.5 <= sw_ver <= 10.0, f"Software version {sw_ver} out of expected range"
-
-    def test_hardware_type_present(self, coordinator: MockCoordinator) -> None:
-        """Hardware type should be present and valid."""
-        hw_type = coordinator.data.get("hardware_type")
-        assert hw_type is not None, "Hardware type should be present"
-        # Valid MAC models: 80, 100, 120, 150, etc.
-        assert 50 <= hw_type <= 500, f"Hardware type {hw_type} out of expected range"
-
     def test_device_info_valid(self, coordinator: MockCoordinator) -> None:
         """Device info should have required fields and valid model format."""
         device_info = coordinator.device_info
@@ -81,7 +119,35 @@ class TestSystemInfo:
         assert "model" in device_info
         model = device_info["model"]
         assert model.startswith("MAC "), f"Model should start with 'MAC ', got {model}"
-        assert re.match(r"^MAC \d+$", model), f"Model should match 'MAC <number>', got {model}"
+        assert _MAC_MODEL_RE.match(model), f"Model should match 'MAC <number>', got {model}"
+
+
+class TestValueRanges:
+    """Range checks for scaled values, one test per (fixture, key)."""
+
+    @pytest.mark.parametrize(
+        ("key", "low", "high", "required"),
+        RANGE_CHECKS,
+        ids=[check[0] for check in RANGE_CHECKS],
+    )
+    def test_value_in_range(
+        self,
+        coord_data: Mapping[str, Any],
+        installed_sensors: Mapping[str, bool],
+        key: str,
+        low: float,
+        high: float,
+        required: bool,
+    ) -> None:
+        """Value should be within its physically reasonable range if present."""
+        if not installed_sensors.get(key, True):
+            pytest.skip(f"{key} sensor not installed")
+        value = coord_data.get(key)
+        if required:
+            assert value is not None, f"{key} should be present"
+        elif value is None:
+            pytest.skip(f"{key} not present")
+        _check_range(key, value, low, high)
 
 
 class TestTemperatures:
@@ -95,45 +161,18 @@ class TestTemperatures:
         "waste_temp",
     ]
 
-    SETPOINT_KEYS = [
-        "exhaust_temp_setpoint",
-        "supply_temp_setpoint",
-    ]
-
-    def test_temperatures_present(self, coordinator: MockCoordinator) -> None:
+    def test_temperatures_present(self, data_keys: frozenset[str]) -> None:
         """At least some temperature values should be present."""
-        present = [key for key in self.TEMP_KEYS if key in coordinator.data]
+        present = [key for key in self.TEMP_KEYS if key in data_keys]
         assert len(present) >= 3, f"Expected at least 3 temperatures, found: {present}"
 
-    @pytest.mark.parametrize("temp_key", TEMP_KEYS)
-    def test_temperature_in_valid_range(self, coordinator: MockCoordinator, temp_key: str) -> None:
-        """Temperature values should be in a physically reasonable range."""
-        if temp_key not in coordinator.data:
-            pytest.skip(f"{temp_key} not present in fixture")
-
-        value = coordinator.data[temp_key]
-        assert value is not None
-        # Allow -50°C to +80°C range for ventilation systems
-        assert -50 <= value <= 80, f"{temp_key}={value}°C out of valid range"
-
-    @pytest.mark.parametrize("setpoint_key", SETPOINT_KEYS)
-    def test_setpoint_in_valid_range(self, coordinator: MockCoordinator, setpoint_key: str) -> None:
-        """Temperature setpoints should be in a reasonable range."""
-        if setpoint_key not in coordinator.data:
-            pytest.skip(f"{setpoint_key} not present in fixture")
-
-        value = coordinator.data[setpoint_key]
-        assert value is not None
-        # Setpoints typically 10°C to 30°C
-        assert 5 <= value <= 35, f"{setpoint_key}={value}°C out of valid range"
-
 
 class TestStates:
     """Test state interpretation."""
 
-    def test_power_state_valid(self, coordinator: MockCoordinator) -> None:
+    def test_power_state_valid(self, coord_data: Mapping[str, Any]) -> None:
         """Power state should be a valid value."""
-        power = coordinator.data.get("power")
+        power = coord_data.get("power")
         if power is None:
             pytest.skip("Power state not present")
 
@@ -141,9 +180,9 @@ class TestStates:
         # V2: 0=Off, 1=On
         assert power in (0, 1, 2, 3), f"Invalid power state: {power}"
 
-    def test_control_state_valid(self, coordinator: MockCoordinator) -> None:
+    def test_control_state_valid(self, coord_data: Mapping[str, Any]) -> None:
         """Control state should be a valid value."""
-        control = coordinator.data.get("control_state")
+        control = coord_data.get("control_state")
         if control is None:
             pytest.skip("Control state not present")
 
@@ -151,78 +190,21 @@ class TestStates:
         # V2: 0=Off, 1=Away, 2=Home, 3=Boost, 4=Sauna, 5=Fireplace
         assert 0 <= control <= 10, f"Invalid control state: {control}"
 
-    def test_defrost_state_binary(self, coordinator: MockCoordinator) -> None:
+    def test_defrost_state_binary(self, coord_data: Mapping[str, Any]) -> None:
         """Defrost state should be binary (0 or 1)."""
-        defrost = coordinator.data.get("defrost_state")
+        defrost = coord_data.get("defrost_state")
         if defrost is None:
             pytest.skip("Defrost state not present")
 
         assert defrost in (0, 1), f"Invalid defrost state: {defrost}"
 
 
-class TestSpeeds:
-    """Test speed-related values."""
-
-    def test_actual_speed_valid(self, coordinator: MockCoordinator) -> None:
-        """Actual speed should be in valid range."""
-        speed = coordinator.data.get("actual_speed")
-        if speed is None:
-            pytest.skip("Actual speed not present")
-
-        # Speed typically 0-5 or similar
-        assert 0 <= speed <= 10, f"Invalid actual speed: {speed}"
-
-    def test_fan_speeds_percentage(self, coordinator: MockCoordinator) -> None:
-        """Fan speeds should be valid percentages."""
-        for key in ("supply_fan_speed", "exhaust_fan_speed"):
-            value = coordinator.data.get(key)
-            if value is None:
-                continue
-
-            assert 0 <= value <= 100, f"{key}={value}% out of valid range"
-
-    def test_preset_speeds_valid(self, coordinator: MockCoordinator) -> None:
-        """Preset speed settings should be valid."""
-        for key in ("home_speed", "away_speed", "boost_setting"):
-            value = coordinator.data.get(key)
-            if value is None:
-                continue
-
-            # Preset speeds typically 1-5
-            assert 0 <= value <= 10, f"{key}={value} out of valid range"
-
-
-class TestOptionalSensors:
-    """Test optional sensor interpretation."""
-
-    def test_humidity_valid_if_present(self, coordinator: MockCoordinator) -> None:
-        """Humidity should be 0-100% if present and installed."""
-        humidity = coordinator.data.get("humidity")
-        raw = coordinator.get_raw_value("humidity")
-
-        if humidity is None or raw in (0, -1, 65535):
-            pytest.skip("Humidity sensor not installed")
-
-        assert 0 <= humidity <= 100, f"Invalid humidity: {humidity}%"
-
-    def test_co2_valid_if_present(self, coordinator: MockCoordinator) -> None:
-        """CO2 should be reasonable ppm if present and installed."""
-        co2 = coordinator.data.get("co2")
-        raw = coordinator.get_raw_value("co2")
-
-        if co2 is None or raw in (0, -1, 65535):
-            pytest.skip("CO2 sensor not installed")
-
-        # CO2 typically 400-5000 ppm in ventilation scenarios
-        assert 200 <= co2 <= 10000, f"Invalid CO2: {co2} ppm"
-
-
 class TestFilterInfo:
     """Test filter information interpretation."""
 
-    def test_filter_state_valid(self, coordinator: MockCoordinator) -> None:
+    def test_filter_state_valid(self, coord_data: Mapping[str, Any]) -> None:
         """Filter state should be valid."""
-        state = coordinator.data.get("filter_state")
+        state = coord_data.get("filter_state")
         if state is None:
             pytest.skip("Filter state not present")
 
@@ -230,27 +212,22 @@ class TestFilterInfo:
         # V2: 0=OK, 1=Ack, 2=Reminder
         assert state in (0, 1, 2), f"Invalid filter state: {state}"
 
-    def test_filter_state_display_mapping_v2(self) -> None:
+    def test_filter_state_display_mapping_v2(self, mac120_v2_coordinator: MockCoordinator) -> None:
         """V2 filter_state=0 (Idle/OK) must display as 'OK', not 'Replace'."""
-        coord = load_dump(PROJECT_ROOT / "tests" / "fixtures" / "MAC120-full-v2.json")
-        state = coord.data.get("filter_state")
+        state = mac120_v2_coordinator.data.get("filter_state")
         assert state is not None, "Fixture must have filter_state"
-        is_v2 = coord.software_version == SOFTWARE_VERSION_2 or str(
-            coord.software_version
-        ).startswith("2.")
-        assert is_v2, "MAC120-full-v2 fixture should be V2"
-        mapping = FILTER_STATE_MAP_V2 if is_v2 else FILTER_STATE_MAP_V1
-        display = mapping.get(int(state), "Unknown")
+        assert mac120_v2_coordinator.is_v2, "MAC120-full-v2 fixture should be V2"
+        display = FILTER_STATE_MAP_V2.get(int(state), "Unknown")
         assert display == "OK", (
             f"V2 filter_state=0 must display 'OK', got '{display}'. "
             "V1 and V2 use different mappings (V1: 0=Replace, V2: 0=OK)."
         )
 
-    def test_filter_date_valid(self, coordinator: MockCoordinator) -> None:
+    def test_filter_date_valid(self, coord_data: Mapping[str, Any]) -> None:
         """Filter date components should be valid."""
-        day = coordinator.data.get("filter_day")
-        month = coordinator.data.get("filter_month")
-        year = coordinator.data.get("filter_year")
+        day = coord_data.get("filter_day")
+        month = coord_data.get("filter_month")
+        year = coord_data.get("filter_year")
 
         if day is None or month is None or year is None:
             pytest.skip("Filter date not present")
@@ -259,66 +236,39 @@ class TestFilterInfo:
         assert 1 <= month <= 12, f"Invalid filter month: {month}"
         assert 2000 <= year <= 3000, f"Invalid filter year: {year}"
 
-    def test_filter_interval_valid(self, coordinator: MockCoordinator) -> None:
-        """Filter interval should be valid."""
-        interval = coordinator.data.get("filter_interval")
-        if interval is None:
-            pytest.skip("Filter interval not present")
-
-        # V2: 0=3 months, 1=4 months, 2=6 months
-        assert 0 <= interval <= 10, f"Invalid filter interval: {interval}"
-
-
-class TestPerformance:
-    """Test performance metrics interpretation."""
-
-    def test_heat_recovery_efficiency_valid(self, coordinator: MockCoordinator) -> None:
-        """Heat recovery efficiency should be 0-100%."""
-        efficiency = coordinator.data.get("heat_recovery_efficiency")
-        if efficiency is None:
-            pytest.skip("Heat recovery efficiency not present")
-
-        assert 0 <= efficiency <= 100, f"Invalid efficiency: {efficiency}%"
-
-    def test_heater_outputs_percentage(self, coordinator: MockCoordinator) -> None:
-        """Heater outputs should be valid percentages."""
-        for key in ("post_heater_output", "pre_heater_output", "heat_recovery_output"):
-            value = coordinator.data.get(key)
-            if value is None:
-                continue
-
-            assert 0 <= value <= 100, f"{key}={value}% out of valid range"
-
 
 class TestScaling:
     """Test that register scaling is applied correctly."""
 
-    def test_temperature_scaling(self, coordinator: MockCoordinator) -> None:
-        """Temperature values should be scaled by 0.1."""
-        # Check that raw/scaled relationship is correct for a temp register
-        raw = coordinator.get_raw_value("supply_temp")
-        scaled = coordinator.data.get("supply_temp")
-
-        if raw is None or scaled is None:
-            pytest.skip("Supply temp not present")
-
-        # With 0.1 scaling, raw 174 should give 17.4
-        expected = raw * 0.1
-        assert abs(scaled - expected) < 0.01, (
-            f"Scaling error: raw={raw}, scaled={scaled}, expected={expected}"
-        )
+    # (key, scale, abs_tol): a temperature register (raw 174 -> 17.4) and the
+    # software version register (raw 225 -> 2.25)
+    SCALING_CHECKS = [
+        ("supply_temp", 0.1, 0.01),
+        ("software_version", 0.01, 0.001),
+    ]
 
-    def test_version_scaling(self, coordinator: MockCoordinator) -> None:
-        """Version values should be scaled by 0.01."""
-        raw = coordinator.get_raw_value("software_version")
-        scaled = coordinator.data.get("software_version")
+    @pytest.mark.parametrize(
+        ("key", "scale", "abs_tol"),
+        SCALING_CHECKS,
+        ids=[check[0] for check in SCALING_CHECKS],
+    )
+    def test_scaling(
+        self,
+        coord_data: Mapping[str, Any],
+        coord_raw: Mapping[str, int | None],
+        key: str,
+        scale: float,
+        abs_tol: float,
+    ) -> None:
+        """Scaled value should equal raw * scale."""
+        raw = coord_raw.get(key)
+        scaled = coord_data.get(key)
 
         if raw is None or scaled is None:
-            pytest.skip("Software version not present")
+            pytest.skip(f"{key} not present")
 
-        # With 0.01 scaling, raw 225 should give 2.25
-        expected = raw * 0.01
-        assert abs(scaled - expected) < 0.001, (
+        expected = raw * scale
+        assert isclose(scaled, expected, rel_tol=1e-6, abs_tol=abs_tol), (
             f"Scaling error: raw={raw}, scaled={scaled}, expected={expected}"
         )
 
@@ -340,32 +290,31 @@ class TestRegisterDefinitions:
         "fresh_air_temp": 1020,
     }
 
-    def test_get_register_definition(self, coordinator: MockCoordinator) -> None:
+    def test_get_register_definition(
+        self, coordinator: MockCoordinator, data_keys: frozenset[str]
+    ) -> None:
         """Register definitions should be retrievable with correct addresses and labels."""
-        expected = (
-            self.V2_EXPECTED_ADDRESSES
-            if coordinator.software_version == SOFTWARE_VERSION_2
-            or str(coordinator.software_version).startswith("2.")
-            else self.V1_EXPECTED_ADDRESSES
-        )
-        for key in ("software_version", "power", "control_state", "fresh_air_temp"):
-            if key not in coordinator.data:
+        expected = self.V2_EXPECTED_ADDRESSES if coordinator.is_v2 else self.V1_EXPECTED_ADDRESSES
+        for key, expected_address in expected.items():
+            if key not in data_keys:
                 continue
 
             definition = coordinator.get_register_definition(key)
             assert definition is not None
             assert definition.key == key
             assert definition.address > 0
-            assert definition.address == expected[key], (
-                f"{key} address should be {expected[key]}, got {definition.address}"
+            assert definition.address == expected_address, (
+                f"{key} address should be {expected_address}, got {definition.address}"
             )
             assert definition.label is not None and len(definition.label) > 0, (
                 f"{key} should have non-empty label"
             )
 
-    def test_overpressure_timer_writable(self, coordinator: MockCoordinator) -> None:
+    def test_overpressure_timer_writable(
+        self, coordinator: MockCoordinator, data_keys: frozenset[str]
+    ) -> None:
         """Overpressure timer register should be writable (was overwritten by duplicate def)."""
-        if "overpressure_timer" not in coordinator.data:
+        if "overpressure_timer" not in data_keys:
             pytest.skip("Overpressure timer not in fixture")
         definition = coordinator.get_register_definition("overpressure_timer")
         assert definition.writable, "overpressure_timer should be writable"
@@ -388,29 +337,29 @@ class TestRegisterMap:
         v2_addr = get_registers_for_version(SOFTWARE_VERSION_2)[REG_POWER].address
         assert v1_addr != v2_addr, "V1 and V2 power addresses must differ"
 
+    def test_polling_keys_unique(self) -> None:
+        """Each register is polled once (a duplicate skewed registers_read in dumps)."""
+        duplicates = sorted(
+            {k for k in POLLING_REGISTER_KEYS if POLLING_REGISTER_KEYS.count(k) > 1}
+        )
+        assert not duplicates, f"Duplicate POLLING_REGISTER_KEYS: {duplicates}"
+
 
+@pytest.mark.v2_only
 class TestV2Specific:
     """Tests specific to V2.x firmware."""
 
-    def test_season_state_v2(self, coordinator: MockCoordinator, is_v2_device: bool) -> None:
+    def test_season_state_v2(self, coord_data: Mapping[str, Any]) -> None:
         """V2 devices should have season state."""
-        if not is_v2_device:
-            pytest.skip("Not a V2 device")
-
-        season = coordinator.data.get("season_state")
+        season = coord_data.get("season_state")
         if season is None:
             pytest.skip("Season state not present")
 
         # V2: 0=Winter, 1=Transition, 2=Summer
         assert season in (0, 1, 2), f"Invalid V2 season state: {season}"
 
-    def test_hardware_type_mapping_v2(
-        self, coordinator: MockCoordinator, is_v2_device: bool
-    ) -> None:
+    def test_hardware_type_mapping_v2(self, coordinator: MockCoordinator) -> None:
         """V2 hardware type codes should map to correct model (e.g. 112 -> MAC 120)."""
-        if not is_v2_device:
-            pytest.skip("Not a V2 device")
-
         hw_type = coordinator.data.get("hardware_type")
         if hw_type is None:
             pytest.skip("Hardware type not present")
@@ -423,14 +372,10 @@ class TestV2Specific:
             f"V2 hw_type {hw_int} should map to {expected_model}, got {device_info['model']}"
         )
 
-    def test_v2_derived_states_binary(
-        self, coordinator: MockCoordinator, is_v2_device: bool
-    ) -> None:
+    def test_v2_derived_states_binary(self, coord_data: Mapping[str, Any]) -> None:
         """V2 home_state, boost_state, overpressure_state must be 0 or 1 (derived from USERSTATECONTROL)."""
-        if not is_v2_device:
-            pytest.skip("Not a V2 device")
         for key in ("home_state", "boost_state", "overpressure_state"):
-            value = coordinator.data.get(key)
+            value = coord_data.get(key)
             if value is None:
                 continue
             assert value in (0, 1), f"{key} must be 0 or 1 for binary sensor, got {value}"
@@ -0,0 +1,37 @@
+"""Load the integration's const.py without importing Home Assistant.
+
+custom_components/parmair/__init__.py imports homeassistant, so the tools load
+const.py straight from its file instead. The module is executed once per process
+and registered as ``parmair_const``; every tool shares that instance (and so the
+same RegisterDefinition class).
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+
+_MODULE_NAME = "parmair_const"
+_CONST_PATH = Path(__file__).parent.parent / "custom_components" / "parmair" / "const.py"
+
+
+def load_const() -> ModuleType:
+    """Return the shared parmair_const module, executing const.py on first use."""
+    module = sys.modules.get(_MODULE_NAME)
+    if module is not None:
+        return module
+
+    spec = importlib.util.spec_from_file_location(_MODULE_NAME, _CONST_PATH)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[_MODULE_NAME] = module  # Register before exec to fix dataclass issues
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[_MODULE_NAME]
+        raise
+    return module
+
+
+const = load_const()
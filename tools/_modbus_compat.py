@@ -0,0 +1,32 @@
+"""Pymodbus slave ID keyword compatibility for the standalone tools.
+
+pymodbus 3.10+ takes device_id=, older 3.x slave= or unit=. The working keyword is
+detected on the first read and reused for the rest of the process (same approach as
+custom_components/parmair/pymodbus_compat.py, which needs Home Assistant to import).
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+_UNIT_KWARGS = ("device_id", "slave", "unit")
+# None = not detected yet; "" = no keyword accepted, client.slave is set instead
+_unit_kwarg: str | None = None
+
+
+def read_holding_registers(client: Any, address: int, count: int, slave_id: int) -> Any:
+    """Call client.read_holding_registers with whichever slave ID keyword it accepts."""
+    global _unit_kwarg
+    if _unit_kwarg is None:
+        for kw in _UNIT_KWARGS:
+            try:
+                result = client.read_holding_registers(address, count=count, **{kw: slave_id})
+            except TypeError:
+                continue
+            _unit_kwarg = kw
+            return result
+        _unit_kwarg = ""
+    if _unit_kwarg:
+        return client.read_holding_registers(address, count=count, **{_unit_kwarg: slave_id})
+    client.slave = slave_id
+    return client.read_holding_registers(address, count)
@@ -5,7 +5,7 @@ This tool scans a range of register addresses and reports which ones
 return valid data. Use this to discover undocumented registers.
 
 Usage:
-    python discover_registers.py <host> [--start 1000] [--end 1300]
+    python discover_registers.py <host> [--start 1000] [--end 1300] [--output FILE [--ndjson]]
 """
 
 from __future__ import annotations
@@ -13,13 +13,38 @@ from __future__ import annotations
 import argparse
 import json
 import sys
+from collections.abc import Iterator, Mapping
+from contextlib import ExitStack
 from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
 
 from pymodbus.client import ModbusTcpClient
 
+# Add parent directory to path so the script can import the shared tools modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from tools._modbus_compat import read_holding_registers  # noqa: E402
+
+try:
+    import orjson
+
+    def _dumps(obj: object) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    def _dumps_line(obj: object) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+
+    def _dumps(obj: object) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+    def _dumps_line(obj: object) -> bytes:
+        return (json.dumps(obj) + "\n").encode()
+
+
 # Known V2 documented registers (from v2_register.md)
-V2_DOCUMENTED = {
+_V2_DOCUMENTED = {
     1003: "ACK_ALARMS",
     1004: "ALARM_COUNT",
     1009: "TIME_YEAR",
@@ -128,31 +153,56 @@ V2_DOCUMENTED = {
     1230: "TE10_LA",
     1240: "FILTER_FA",
 }
+V2_DOCUMENTED: Mapping[int, str] = MappingProxyType(_V2_DOCUMENTED)
 
 
-def read_register(client: ModbusTcpClient, address: int, slave_id: int) -> int | None:
-    """Try to read a single register. pymodbus 3.10+ uses device_id=; older uses slave=."""
-    try:
-        result = client.read_holding_registers(address, count=1, device_id=slave_id)
-    except TypeError:
-        try:
-            result = client.read_holding_registers(address, count=1, slave=slave_id)
-        except TypeError:
-            try:
-                result = client.read_holding_registers(address, 1, unit=slave_id)
-            except TypeError:
-                return None
+# Modbus limit for a single read_holding_registers request
+CHUNK = 125
 
+
+def read_block(
+    client: ModbusTcpClient, address: int, count: int, slave_id: int
+) -> list[int] | None:
+    """Try to read consecutive registers (None on error, so scan_block can bisect)."""
     try:
+        result = read_holding_registers(client, address, count, slave_id)
+        if result is None:
+            return None
         if hasattr(result, "isError") and result.isError():
             return None
-        if hasattr(result, "registers") and result.registers:
-            return result.registers[0]
+        if hasattr(result, "registers") and len(result.registers) == count:
+            return list(result.registers)
         return None
     except Exception:
         return None
 
 
+def read_register(client: ModbusTcpClient, address: int, slave_id: int) -> int | None:
+    """Try to read a single register."""
+    values = read_block(client, address, 1, slave_id)
+    return values[0] if values else None
+
+
+def scan_block(
+    client: ModbusTcpClient, address: int, count: int, slave_id: int
+) -> Iterator[tuple[int, int]]:
+    """Yield (address, value) for every readable register in a block.
+
+    The whole block is read in one request. If the device rejects it (e.g. one
+    address in the span is unreadable), the block is split in half and each half
+    retried, down to single registers, so only the bad addresses are skipped.
+    """
+    values = read_block(client, address, count, slave_id)
+    if values is not None:
+        yield from zip(range(address, address + count), values, strict=True)
+        return
+    if count == 1:
+        return
+    half = count // 2
+    yield from scan_block(client, address, half, slave_id)
+    yield from scan_block(client, address + half, count - half, slave_id)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Discover Modbus registers on Parmair device")
     parser.add_argument("host", help="Device IP address")
@@ -161,8 +211,15 @@ def main():
     parser.add_argument("--start", type=int, default=1000, help="Start address (default: 1000)")
     parser.add_argument("--end", type=int, default=1300, help="End address (default: 1300)")
     parser.add_argument("--output", type=str, help="Output JSON file")
+    parser.add_argument(
+        "--ndjson",
+        action="store_true",
+        help="Stream --output as NDJSON (header line, then one line per register) while scanning",
+    )
 
     args = parser.parse_args()
+    if args.ndjson and not args.output:
+        parser.error("--ndjson requires --output")
 
     print(f"Connecting to {args.host}:{args.port}...")
     client = ModbusTcpClient(args.host, port=args.port)
@@ -174,61 +231,81 @@ def main():
     print(f"Scanning registers {args.start} to {args.end}...")
     print()
 
+    header = {
+        "host": args.host,
+        "timestamp": datetime.now().isoformat(),
+        "scan_range": {"start": args.start, "end": args.end},
+    }
+    # In NDJSON mode entries go straight to the file and only the counts are kept
     documented = []
     undocumented = []
+    n_documented = 0
+    n_undocumented = 0
 
-    for addr in range(args.start, args.end + 1):
-        value = read_register(client, addr, args.slave)
+    with ExitStack() as stack:
+        stream = stack.enter_context(open(args.output, "wb")) if args.ndjson else None
+        stack.callback(client.close)
+        if stream is not None:
+            stream.write(_dumps_line(header))
 
-        if value is not None:
-            is_documented = addr in V2_DOCUMENTED
-            label = V2_DOCUMENTED.get(addr, "???")
-            status = "✓" if is_documented else "?"
+        for chunk_start in range(args.start, args.end + 1, CHUNK):
+            chunk_count = min(CHUNK, args.end - chunk_start + 1)
+            lines = []
+            for addr, value in scan_block(client, chunk_start, chunk_count, args.slave):
+                label = V2_DOCUMENTED.get(addr)
+                is_documented = label is not None
+                if label is None:
+                    label = "???"
+                status = "✓" if is_documented else "?"
 
-            entry = {
-                "address": addr,
-                "value": value,
-                "label": label,
-                "documented": is_documented,
-            }
+                entry = {
+                    "address": addr,
+                    "value": value,
+                    "label": label,
+                    "documented": is_documented,
+                }
 
-            if is_documented:
-                documented.append(entry)
-            else:
-                undocumented.append(entry)
+                if is_documented:
+                    n_documented += 1
+                else:
+                    n_undocumented += 1
+                if stream is not None:
+                    stream.write(_dumps_line(entry))
+                elif is_documented:
+                    documented.append(entry)
+                else:
+                    undocumented.append(entry)
 
-            # Print progress
-            print(f"  {status} {addr:4d}: {value:6d}  {label}")
+                lines.append(f"  {status} {addr:4d}: {value:6d}  {label}\n")
 
-    client.close()
+            # Print progress once per chunk rather than once per register
+            sys.stdout.write("".join(lines))
+            sys.stdout.flush()
 
     print()
     print("=" * 60)
     print("SUMMARY")
     print("=" * 60)
-    print(f"Documented registers found: {len(documented)}")
-    print(f"Undocumented registers found: {len(undocumented)}")
+    print(f"Documented registers found: {n_documented}")
+    print(f"Undocumented registers found: {n_undocumented}")
     print()
 
     if undocumented:
         print("UNDOCUMENTED REGISTERS (need investigation):")
         print("-" * 60)
-        for entry in undocumented:
-            print(f"  Address {entry['address']:4d}: value={entry['value']:6d}")
+        sys.stdout.write(
+            "".join(
+                f"  Address {entry['address']:4d}: value={entry['value']:6d}\n"
+                for entry in undocumented
+            )
+        )
 
     # Save to file if requested
     if args.output:
-        output_data = {
-            "host": args.host,
-            "timestamp": datetime.now().isoformat(),
-            "scan_range": {"start": args.start, "end": args.end},
-            "documented": documented,
-            "undocumented": undocumented,
-        }
-
         output_path = Path(args.output)
-        with open(output_path, "w") as f:
-            json.dump(output_data, f, indent=2)
+        if not args.ndjson:
+            output_data = {**header, "documented": documented, "undocumented": undocumented}
+            output_path.write_bytes(_dumps(output_data))
         print(f"\nResults saved to: {output_path}")
 
 
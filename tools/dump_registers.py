@@ -11,41 +11,63 @@ Examples:
     python dump_registers.py 192.168.1.100
     python dump_registers.py 192.168.1.100 --output dumps/my_device.json
     python dump_registers.py 192.168.1.100 --port 502 --slave-id 1 --version 2.x
+    python dump_registers.py 192.168.1.100 --jsonl
 """
 
 from __future__ import annotations
 
 import argparse
+import functools
 import json
+import socket
 import sys
+import threading
 import time
+from array import array
+from collections.abc import Iterable
+from contextlib import ExitStack
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
 # Add parent directory to path to import from custom_components
 sys.path.insert(0, str(Path(__file__).parent.parent))
-import importlib.util
-
 from pymodbus.client import ModbusTcpClient
 from pymodbus.exceptions import ModbusException
 
-# Import const.py directly to avoid homeassistant dependency in __init__.py
-_const_path = Path(__file__).parent.parent / "custom_components" / "parmair" / "const.py"
-_spec = importlib.util.spec_from_file_location("parmair_const", _const_path)
-_const = importlib.util.module_from_spec(_spec)
-sys.modules["parmair_const"] = _const  # Register module to fix dataclass issues
-_spec.loader.exec_module(_const)
+# Load const.py directly to avoid homeassistant dependency in __init__.py
+from tools._const_loader import const as _const
+from tools._modbus_compat import read_holding_registers
+
+try:
+    import orjson
+
+    def _dumps(obj: object) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    def _dumps_line(obj: object) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+
+    def _dumps(obj: object) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode()
+
+    def _dumps_line(obj: object) -> bytes:
+        return (json.dumps(obj, ensure_ascii=False) + "\n").encode()
+
 
 POLLING_REGISTER_KEYS = _const.POLLING_REGISTER_KEYS
 SOFTWARE_VERSION_1 = _const.SOFTWARE_VERSION_1
 SOFTWARE_VERSION_2 = _const.SOFTWARE_VERSION_2
 RegisterDefinition = _const.RegisterDefinition
-get_registers_for_version = _const.get_registers_for_version
+# Register maps are immutable per version; build each one once. Callers must not mutate
+# the returned dict.
+get_registers_for_version = functools.lru_cache(maxsize=None)(_const.get_registers_for_version)
 
 
-@dataclass
+@dataclass(slots=True)
 class RegisterDump:
     """Container for a single register dump."""
 
@@ -59,7 +81,7 @@ class RegisterDump:
     writable: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceDump:
     """Container for complete device dump."""
 
@@ -74,6 +96,10 @@ class DeviceDump:
             ensure_ascii=False,
         )
 
+    def to_bytes(self) -> bytes:
+        """Convert to UTF-8 encoded JSON (uses orjson when available)."""
+        return _dumps({"metadata": self.metadata, "registers": self.registers})
+
     @classmethod
     def from_json(cls, json_str: str) -> DeviceDump:
         """Create from JSON string."""
@@ -81,48 +107,116 @@ class DeviceDump:
         return cls(metadata=data["metadata"], registers=data["registers"])
 
 
-def read_single_register(
+@functools.cache
+def _split_polling_keys(software_version: str) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """Split POLLING_REGISTER_KEYS into (in the version's register map, missing from it)."""
+    registers = get_registers_for_version(software_version)
+    present = tuple(key for key in POLLING_REGISTER_KEYS if key in registers)
+    missing = tuple(key for key in POLLING_REGISTER_KEYS if key not in registers)
+    return present, missing
+
+
+# Modbus allows 125 registers per read; stay a little below it
+MAX_SPAN = 120
+
+# Default pause between requests; the device mixes up transaction IDs when polled back to back
+READ_DELAY = 0.25
+
+
+class Pacer:
+    """Space requests at least min_interval apart, counting time spent in the request.
+
+    Unlike a fixed sleep before every read, a request that itself took longer than
+    min_interval is followed immediately by the next one.
+    """
+
+    def __init__(self, min_interval: float = READ_DELAY) -> None:
+        """Initialize the pacer; the first wait() returns immediately."""
+        self.min_interval = min_interval
+        self._next_allowed = 0.0
+
+    def wait(self) -> None:
+        """Block until the next request may be sent, then start the next interval."""
+        delay = self._next_allowed - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        self._next_allowed = time.monotonic() + self.min_interval
+
+
+def build_read_spans(
+    addresses: Iterable[int], max_registers: int = MAX_SPAN
+) -> list[tuple[int, int]]:
+    """Group addresses into consecutive (start_address, count) spans for batch reads."""
+    sorted_addresses = sorted(set(addresses))
+    if not sorted_addresses:
+        return []
+    spans: list[tuple[int, int]] = []
+    start = sorted_addresses[0]
+    count = 1
+    for prev, curr in zip(sorted_addresses[:-1], sorted_addresses[1:], strict=True):
+        if curr == prev + 1 and count < max_registers:
+            count += 1
+        else:
+            spans.append((start, count))
+            start = curr
+            count = 1
+    spans.append((start, count))
+    return spans
+
+
+def read_block(
     client: ModbusTcpClient,
-    definition: RegisterDefinition,
+    address: int,
+    count: int,
     slave_id: int,
-) -> tuple[int | None, float | int | None]:
-    """Read a single register and return (raw, scaled) values."""
-    # pymodbus 3.11+ uses: address (positional), count= (keyword), device_id= (keyword)
+) -> list[int] | None:
+    """Read count consecutive holding registers; return them as signed int16 or None.
+
+    Exceptions (timeouts, ModbusIOException, connection resets) also return None, so
+    read_spans can retry the span and fall back to single registers.
+    """
     try:
-        result = client.read_holding_registers(definition.address, count=1, device_id=slave_id)
-    except TypeError:
-        # Fallback for older pymodbus versions
-        try:
-            result = client.read_holding_registers(definition.address, 1, slave=slave_id)
-        except TypeError:
-            try:
-                result = client.read_holding_registers(definition.address, 1, unit=slave_id)
-            except TypeError:
-                client.slave = slave_id
-                result = client.read_holding_registers(definition.address, 1)
+        result = read_holding_registers(client, address, count, slave_id)
+    except Exception:
+        return None
 
     if not result or (hasattr(result, "isError") and result.isError()):
-        return None, None
+        return None
 
     if hasattr(result, "registers"):
-        raw = result.registers[0]
+        values = list(result.registers)
     elif isinstance(result, list | tuple):
-        raw = result[0]
+        values = list(result)
     else:
-        raw = result
+        values = [result]
+
+    if len(values) < count:
+        return None
+    # Reinterpret the whole block as signed int16 (negative temperatures) in one C-level
+    # pass: 0..32767 stay, 32768..65535 become -32768..-1
+    return array("h", array("H", values[:count]).tobytes()).tolist()
 
-    # Convert to signed int16 if value is > 32767 (handle negative temperatures)
-    if raw > 32767:
-        raw = raw - 65536
 
+def convert_value(definition: RegisterDefinition, raw: int) -> tuple[int, float | int | None]:
+    """Convert a signed register value (from read_block) to (raw, scaled) for a definition."""
     # Check if optional sensor is not installed
     if definition.optional and raw < 0:
         return raw, None
 
     # Apply scaling
-    scaled = raw if definition.scale == 1 else raw * definition.scale
+    return raw, raw if definition.scale == 1 else raw * definition.scale
+
 
-    return raw, scaled
+def read_single_register(
+    client: ModbusTcpClient,
+    definition: RegisterDefinition,
+    slave_id: int,
+) -> tuple[int | None, float | int | None]:
+    """Read a single register and return (raw, scaled) values."""
+    values = read_block(client, definition.address, 1, slave_id)
+    if values is None:
+        return None, None
+    return convert_value(definition, values[0])
 
 
 def read_register_with_retry(
@@ -142,127 +236,253 @@ def read_register_with_retry(
     return None, None
 
 
+def read_block_with_retry(
+    client: ModbusTcpClient,
+    address: int,
+    count: int,
+    slave_id: int,
+    max_attempts: int = 3,
+    retry_delay: float = 0.5,
+) -> list[int] | None:
+    """Read a span of registers with retries on failure (e.g. transaction_id mismatch)."""
+    for attempt in range(max_attempts):
+        if attempt > 0:
+            time.sleep(retry_delay)
+        values = read_block(client, address, count, slave_id)
+        if values is not None:
+            return values
+    return None
+
+
+def read_spans(
+    client: ModbusTcpClient,
+    spans: list[tuple[int, int]],
+    slave_id: int,
+    pacer: Pacer | None = None,
+    verbose: bool = False,
+) -> dict[int, int]:
+    """Read each span in one request and return address -> signed int16 value.
+
+    A span that keeps failing is re-read one register at a time, so a single
+    unreadable address only loses that register.
+    """
+    pacer = pacer or Pacer()
+    values_by_address: dict[int, int] = {}
+    for start, count in spans:
+        pacer.wait()  # Space out reads to prevent transaction_id mismatch
+        values = read_block_with_retry(client, start, count, slave_id)
+        if values is not None:
+            values_by_address.update(zip(range(start, start + count), values, strict=True))
+            continue
+
+        if count == 1:
+            continue
+        if verbose:
+            print(f"  [WARN] Block read {start}-{start + count - 1} failed, reading singly")
+        for address in range(start, start + count):
+            pacer.wait()
+            values = read_block_with_retry(client, address, 1, slave_id)
+            if values is not None:
+                values_by_address[address] = values[0]
+    return values_by_address
+
+
+# Open clients keyed by (host, port), reused across dump_device calls in one process
+_client_cache: dict[tuple[str, int], ModbusTcpClient] = {}
+_client_cache_lock = threading.Lock()
+
+
+def _tune_socket(client: ModbusTcpClient) -> None:
+    """Disable Nagle and enable keepalive on the client's TCP socket, if exposed."""
+    sock = getattr(client, "socket", None)
+    if sock is None:
+        return
+    try:
+        # Modbus frames are tiny request/response pairs; don't let Nagle hold them back
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        # Linux-only knobs to notice a dead peer within about a minute
+        for option, value in (("TCP_KEEPIDLE", 30), ("TCP_KEEPINTVL", 10), ("TCP_KEEPCNT", 3)):
+            if hasattr(socket, option):
+                sock.setsockopt(socket.IPPROTO_TCP, getattr(socket, option), value)
+    except OSError:
+        pass
+
+
+def _get_client(host: str, port: int) -> tuple[ModbusTcpClient, bool]:
+    """Return a connected client for (host, port) and whether it was newly connected."""
+    with _client_cache_lock:
+        client = _client_cache.get((host, port))
+        if client is not None and client.connected:
+            return client, False
+
+        client = client or ModbusTcpClient(host=host, port=port)
+        if not client.connect():
+            raise ModbusException(f"Failed to connect to {host}:{port}")
+        _tune_socket(client)
+        _client_cache[(host, port)] = client
+        return client, True
+
+
+def close_clients() -> None:
+    """Close every cached client."""
+    with _client_cache_lock:
+        for client in _client_cache.values():
+            client.close()
+        _client_cache.clear()
+
+
 def dump_device(
     host: str,
     port: int = 502,
     slave_id: int = 1,
     software_version: str = SOFTWARE_VERSION_1,
     verbose: bool = False,
+    read_delay: float = READ_DELAY,
+    jsonl_path: Path | None = None,
 ) -> DeviceDump:
-    """Connect to device and dump all registers."""
+    """Connect to device (or reuse an open connection) and dump all registers.
+
+    The connection stays open for later calls; call close_clients() when done.
+
+    If jsonl_path is given, the dump is written there as JSON Lines while decoding
+    (a metadata line, one line per register, then a summary line with the counts)
+    and the returned DeviceDump carries only the metadata. The file is only created
+    once the device is connected, so a failed connection leaves nothing behind.
+    """
     print(f"Connecting to Parmair device at {host}:{port} (slave ID: {slave_id})")
     print(f"Using register map for software version: {software_version}")
 
-    client = ModbusTcpClient(host=host, port=port)
+    client, connected = _get_client(host, port)
 
-    if not client.connect():
-        raise ModbusException(f"Failed to connect to {host}:{port}")
+    if connected:
+        print("✓ Connected successfully\n")
 
-    print("✓ Connected successfully\n")
+        # Longer delay after connect to allow device to stabilize and prevent transaction_id mismatch
+        time.sleep(0.3)
+    else:
+        print("✓ Reusing open connection\n")
 
-    # Longer delay after connect to allow device to stabilize and prevent transaction_id mismatch
-    time.sleep(0.3)
+    with ExitStack() as stack:
+        # JSON Lines go straight to the file while reading
+        stream: BinaryIO | None = (
+            stack.enter_context(open(jsonl_path, "wb")) if jsonl_path is not None else None
+        )
 
-    # Get version-specific register map
-    registers = get_registers_for_version(software_version)
+        # Get version-specific register map
+        registers = get_registers_for_version(software_version)
+        pacer = Pacer(read_delay)
 
-    # First, try to detect actual software version if we're on auto
-    detected_version = None
-    detected_hw_type = None
+        # First, try to detect actual software version if we're on auto
+        detected_version = None
+        detected_hw_type = None
 
-    try:
-        # Read software version register
-        sw_def = registers.get("software_version")
-        if sw_def:
-            raw, scaled = read_register_with_retry(
-                client, sw_def, slave_id, max_attempts=3, retry_delay=0.5
-            )
-            if scaled is not None:
-                detected_version = scaled
-                print(f"Detected software version: {detected_version}")
-
-        # Read hardware type register
-        hw_def = registers.get("hardware_type")
-        if hw_def:
-            time.sleep(0.25)  # Delay between reads to prevent transaction ID conflicts
-            raw, scaled = read_register_with_retry(
-                client, hw_def, slave_id, max_attempts=3, retry_delay=0.5
+        try:
+            # Read software version register
+            sw_def = registers.get("software_version")
+            if sw_def:
+                pacer.wait()
+                raw, scaled = read_register_with_retry(
+                    client, sw_def, slave_id, max_attempts=3, retry_delay=0.5
+                )
+                if scaled is not None:
+                    detected_version = scaled
+                    print(f"Detected software version: {detected_version}")
+
+            # Read hardware type register
+            hw_def = registers.get("hardware_type")
+            if hw_def:
+                pacer.wait()  # Space out reads to prevent transaction ID conflicts
+                raw, scaled = read_register_with_retry(
+                    client, hw_def, slave_id, max_attempts=3, retry_delay=0.5
+                )
+                if scaled is not None:
+                    detected_hw_type = int(scaled)
+                    print(f"Detected hardware type: MAC {detected_hw_type}")
+
+        except Exception as e:
+            print(f"Warning: Could not auto-detect device info: {e}")
+
+        print("\nReading registers...")
+
+        metadata: dict[str, Any] = {
+            "timestamp": datetime.now().isoformat(),
+            "host": host,
+            "port": port,
+            "slave_id": slave_id,
+            "register_map_version": software_version,
+            "detected_software_version": detected_version,
+            "detected_hardware_type": detected_hw_type,
+        }
+        if stream is not None:
+            stream.write(_dumps_line({"metadata": metadata}))
+
+        register_dumps: dict[str, dict[str, Any]] = {}
+        failed_count = 0
+        success_count = 0
+
+        polled_keys, missing_keys = _split_polling_keys(software_version)
+        if verbose and missing_keys:
+            print(
+                f"  [SKIP] {len(missing_keys)} keys not in register map for {software_version}: "
+                + ", ".join(missing_keys)
             )
-            if scaled is not None:
-                detected_hw_type = int(scaled)
-                print(f"Detected hardware type: MAC {detected_hw_type}")
-
-    except Exception as e:
-        print(f"Warning: Could not auto-detect device info: {e}")
-
-    print("\nReading registers...")
-
-    register_dumps: dict[str, dict[str, Any]] = {}
-    failed_count = 0
-    success_count = 0
-
-    for key in POLLING_REGISTER_KEYS:
-        if key not in registers:
-            if verbose:
-                print(f"  [SKIP] {key}: Not in register map for {software_version}")
-            continue
-
-        definition = registers[key]
-        time.sleep(0.25)  # Delay between reads to prevent transaction_id mismatch
-
-        raw, scaled = read_register_with_retry(
-            client, definition, slave_id, max_attempts=3, retry_delay=0.5
-        )
-
-        if raw is None:
-            failed_count += 1
-            if verbose:
-                print(f"  [FAIL] {key} (addr {definition.address}): Read failed")
-            register_dumps[key] = {
-                "address": definition.address,
-                "label": definition.label,
-                "raw": None,
-                "scaled": None,
-                "scale": definition.scale,
-                "optional": definition.optional,
-                "writable": definition.writable,
-                "error": "Read failed",
-            }
-        else:
-            success_count += 1
-            if verbose:
-                scaled_str = f"{scaled}" if scaled is not None else "N/A"
-                print(f"  [OK]   {key} (addr {definition.address}): raw={raw}, scaled={scaled_str}")
-            register_dumps[key] = {
-                "address": definition.address,
-                "label": definition.label,
-                "raw": raw,
-                "scaled": scaled,
-                "scale": definition.scale,
-                "optional": definition.optional,
-                "writable": definition.writable,
-            }
-
-    client.close()
-
-    print(f"\n✓ Read {success_count} registers successfully")
-    if failed_count > 0:
-        print(f"✗ Failed to read {failed_count} registers")
-
-    # Build metadata
-    metadata = {
-        "timestamp": datetime.now().isoformat(),
-        "host": host,
-        "port": port,
-        "slave_id": slave_id,
-        "register_map_version": software_version,
-        "detected_software_version": detected_version,
-        "detected_hardware_type": detected_hw_type,
-        "registers_read": success_count,
-        "registers_failed": failed_count,
-    }
-
-    return DeviceDump(metadata=metadata, registers=register_dumps)
+        definitions = {key: registers[key] for key in polled_keys}
+
+        # Read contiguous address spans in one request each instead of one request per key
+        spans = build_read_spans(definition.address for definition in definitions.values())
+        values_by_address = read_spans(client, spans, slave_id, pacer=pacer, verbose=verbose)
+
+        for key, definition in definitions.items():
+            value = values_by_address.get(definition.address)
+            raw, scaled = (None, None) if value is None else convert_value(definition, value)
+
+            if raw is None:
+                failed_count += 1
+                if verbose:
+                    print(f"  [FAIL] {key} (addr {definition.address}): Read failed")
+                entry = {
+                    "address": definition.address,
+                    "label": definition.label,
+                    "raw": None,
+                    "scaled": None,
+                    "scale": definition.scale,
+                    "optional": definition.optional,
+                    "writable": definition.writable,
+                    "error": "Read failed",
+                }
+            else:
+                success_count += 1
+                if verbose:
+                    scaled_str = f"{scaled}" if scaled is not None else "N/A"
+                    print(
+                        f"  [OK]   {key} (addr {definition.address}): raw={raw}, scaled={scaled_str}"
+                    )
+                entry = {
+                    "address": definition.address,
+                    "label": definition.label,
+                    "raw": raw,
+                    "scaled": scaled,
+                    "scale": definition.scale,
+                    "optional": definition.optional,
+                    "writable": definition.writable,
+                }
+
+            if stream is not None:
+                stream.write(_dumps_line({"key": key, **entry}))
+            else:
+                register_dumps[key] = entry
+
+        print(f"\n✓ Read {success_count} registers successfully")
+        if failed_count > 0:
+            print(f"✗ Failed to read {failed_count} registers")
+
+        counts = {"registers_read": success_count, "registers_failed": failed_count}
+        metadata.update(counts)
+        if stream is not None:
+            stream.write(_dumps_line({"summary": counts}))
+
+        return DeviceDump(metadata=metadata, registers=register_dumps)
 
 
 def main():
@@ -300,6 +520,17 @@ Examples:
     parser.add_argument(
         "--verbose", "-v", action="store_true", help="Show detailed register readings"
     )
+    parser.add_argument(
+        "--jsonl",
+        action="store_true",
+        help="Write JSON Lines while reading instead of pretty JSON at the end",
+    )
+    parser.add_argument(
+        "--read-delay",
+        type=float,
+        default=READ_DELAY,
+        help=f"Minimum seconds between the start of consecutive requests (default: {READ_DELAY})",
+    )
 
     args = parser.parse_args()
 
@@ -311,23 +542,26 @@ Examples:
         safe_host = args.host.replace(".", "_")
         output_dir = Path(__file__).parent / "dumps"
         output_dir.mkdir(exist_ok=True)
-        output_path = output_dir / f"{safe_host}_{timestamp}.json"
+        suffix = ".jsonl" if args.jsonl else ".json"
+        output_path = output_dir / f"{safe_host}_{timestamp}{suffix}"
 
     try:
+        # Ensure output directory exists
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # JSON Lines are written while reading; pretty JSON once the dump is complete
         dump = dump_device(
             host=args.host,
             port=args.port,
             slave_id=args.slave_id,
             software_version=args.version,
             verbose=args.verbose,
+            read_delay=args.read_delay,
+            jsonl_path=output_path if args.jsonl else None,
         )
 
-        # Ensure output directory exists
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Write JSON file
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(dump.to_json())
+        if not args.jsonl:
+            output_path.write_bytes(dump.to_bytes())
 
         print(f"\n✓ Dump saved to: {output_path}")
 
@@ -351,6 +585,8 @@ Examples:
     except Exception as e:
         print(f"\n✗ Error: {e}", file=sys.stderr)
         sys.exit(1)
+    finally:
+        close_clients()
 
 
 if __name__ == "__main__":
@@ -13,22 +13,22 @@ Usage:
 
 from __future__ import annotations
 
-import importlib.util
+import functools
 import json
 import sys
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is optional; fall back to the stdlib decoder
+    _json_loads = json.loads
+
 # Add parent directory to path to import from custom_components
 sys.path.insert(0, str(Path(__file__).parent.parent))
-
-# Import const.py directly to avoid homeassistant dependency in __init__.py
-_const_path = Path(__file__).parent.parent / "custom_components" / "parmair" / "const.py"
-_spec = importlib.util.spec_from_file_location("parmair_const", _const_path)
-_const = importlib.util.module_from_spec(_spec)
-sys.modules["parmair_const"] = _const  # Register module to fix dataclass issues
-_spec.loader.exec_module(_const)
+# Load const.py directly to avoid homeassistant dependency in __init__.py
+from tools._const_loader import const as _const
 
 SOFTWARE_VERSION_1 = _const.SOFTWARE_VERSION_1
 SOFTWARE_VERSION_2 = _const.SOFTWARE_VERSION_2
@@ -37,7 +37,33 @@ REG_POWER = _const.REG_POWER
 REG_CONTROL_STATE = _const.REG_CONTROL_STATE
 RegisterDefinition = _const.RegisterDefinition
 get_register_definition = _const.get_register_definition
-get_registers_for_version = _const.get_registers_for_version
+# Register maps are immutable per version; build each one once. Callers must not mutate
+# the returned dict.
+get_registers_for_version = functools.lru_cache(maxsize=None)(_const.get_registers_for_version)
+
+# v2.x USERSTATECONTROL_FO (0=Off, 1=Away, 2=Home, 3=Boost, 4=Sauna, 5=Fireplace) ->
+# (home_state, boost_state, overpressure_state); any other value maps to all zeros
+_V2_STATE_TABLE: dict[int, tuple[int, int, int]] = {
+    2: (1, 0, 0),
+    3: (0, 1, 0),
+    4: (0, 0, 1),
+    5: (0, 0, 1),
+}
+_V2_STATE_DEFAULT = (0, 0, 0)
+
+
+def _is_v2_version(software_version: str) -> bool:
+    """Return True if software_version selects the v2.x register map."""
+    return software_version == SOFTWARE_VERSION_2 or str(software_version).startswith("2.")
+
+
+def _derive_v2_states(data: dict[str, Any]) -> None:
+    """Add the v2.x binary states derived from control_state to data, in place."""
+    user_state = data.get("control_state")
+    if user_state is not None:
+        data["home_state"], data["boost_state"], data["overpressure_state"] = _V2_STATE_TABLE.get(
+            user_state, _V2_STATE_DEFAULT
+        )
 
 
 @dataclass
@@ -77,6 +103,7 @@ class MockCoordinator:
         self._metadata = metadata
         self._raw_registers = registers
         self._software_version = software_version
+        self._is_v2 = _is_v2_version(software_version)
         self._registers = get_registers_for_version(software_version)
 
     @property
@@ -100,18 +127,23 @@ class MockCoordinator:
         return self._software_version
 
     @property
+    def is_v2(self) -> bool:
+        """Return True if the V2.x register map is in use."""
+        return self._is_v2
+
+    @functools.cached_property
     def device_info(self) -> dict[str, Any]:
-        """Return device information (compatible with HA device_info)."""
+        """Return device information (compatible with HA device_info).
+
+        Built on first access and cached; the data it derives from never changes.
+        """
         sw_version = self._data.get("software_version")
         hw_type = self._data.get("hardware_type")
 
         model = "MAC"
         if hw_type is not None:
             hw_int = int(hw_type)
-            is_v2 = self._software_version == SOFTWARE_VERSION_2 or str(
-                self._software_version
-            ).startswith("2.")
-            model_num = HARDWARE_TYPE_MAP_V2.get(hw_int, hw_int) if is_v2 else hw_int
+            model_num = HARDWARE_TYPE_MAP_V2.get(hw_int, hw_int) if self._is_v2 else hw_int
             model = f"MAC {model_num}"
 
         device_info = {
@@ -153,8 +185,7 @@ class MockCoordinator:
         if not filepath.exists():
             raise FileNotFoundError(f"Dump file not found: {filepath}")
 
-        with open(filepath, encoding="utf-8") as f:
-            dump = json.load(f)
+        dump = _json_loads(filepath.read_bytes())
 
         metadata = dump.get("metadata", {})
         registers = dump.get("registers", {})
@@ -167,24 +198,17 @@ class MockCoordinator:
         if detected_ver is not None:
             software_version = SOFTWARE_VERSION_2 if detected_ver >= 2.0 else SOFTWARE_VERSION_1
 
-        # Build data dict from scaled values
-        data: dict[str, Any] = {}
-        for key, reg_data in registers.items():
-            if reg_data.get("scaled") is not None:
-                data[key] = reg_data["scaled"]
-            elif reg_data.get("raw") is not None:
-                # For registers without scaling, use raw value
-                data[key] = reg_data["raw"]
+        # Build data dict from scaled values; registers without scaling use the raw value
+        data: dict[str, Any] = {
+            key: value
+            for key, reg_data in registers.items()
+            if (value := reg_data.get("scaled")) is not None
+            or (value := reg_data.get("raw")) is not None
+        }
 
         # v2.x: derive home_state, boost_state, overpressure_state from control_state
-        # (USERSTATECONTROL_FO: 0=Off, 1=Away, 2=Home, 3=Boost, 4=Sauna, 5=Fireplace)
-        is_v2 = software_version == SOFTWARE_VERSION_2 or str(software_version).startswith("2.")
-        if is_v2:
-            user_state = data.get("control_state")
-            if user_state is not None:
-                data["home_state"] = 1 if user_state == 2 else 0
-                data["boost_state"] = 1 if user_state == 3 else 0
-                data["overpressure_state"] = 1 if user_state in (4, 5) else 0
+        if _is_v2_version(software_version):
+            _derive_v2_states(data)
 
         return cls(
             data=data,
@@ -239,14 +263,9 @@ class MockCoordinator:
         }
 
         # v2.x: derive home_state, boost_state, overpressure_state from control_state
-        is_v2 = software_version == SOFTWARE_VERSION_2 or str(software_version).startswith("2.")
-        if is_v2:
+        if _is_v2_version(software_version):
             data = dict(data)  # Copy to avoid mutating user input
-            user_state = data.get("control_state")
-            if user_state is not None:
-                data["home_state"] = 1 if user_state == 2 else 0
-                data["boost_state"] = 1 if user_state == 3 else 0
-                data["overpressure_state"] = 1 if user_state in (4, 5) else 0
+            _derive_v2_states(data)
 
         return cls(
             data=data,
@@ -261,14 +280,27 @@ class MockCoordinator:
         return f"MockCoordinator(source={source}, registers={len(self._data)})"
 
 
+@functools.lru_cache(maxsize=32)
+def _load_dump_cached(path: str, mtime_ns: int) -> MockCoordinator:  # noqa: ARG001
+    """Load a dump file; mtime_ns is part of the cache key so edited files are re-read."""
+    return MockCoordinator.from_file(path)
+
+
 # Convenience function for quick loading
 def load_dump(filepath: str | Path) -> MockCoordinator:
     """Load a dump file and return a MockCoordinator.
 
+    Results are cached by resolved path and modification time, so repeated loads of
+    the same unchanged file return the same (shared) instance. Do not mutate it; use
+    MockCoordinator.from_file() for a private copy.
+
     Args:
         filepath: Path to the JSON dump file
 
     Returns:
         MockCoordinator instance
     """
-    return MockCoordinator.from_file(filepath)
+    path = Path(filepath).resolve()
+    if not path.exists():
+        raise FileNotFoundError(f"Dump file not found: {filepath}")
+    return _load_dump_cached(str(path), path.stat().st_mtime_ns)
@@ -19,24 +19,24 @@ Examples:
 from __future__ import annotations
 
 import argparse
+import contextlib
+import io
+import itertools
+import os
 import sys
+from collections import defaultdict
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
-import importlib.util
-
+# Load const.py directly to avoid homeassistant dependency in __init__.py
+from tools._const_loader import const as _const
 from tools.mock_coordinator import MockCoordinator, load_dump
 
-# Import const.py directly to avoid homeassistant dependency in __init__.py
-_const_path = Path(__file__).parent.parent / "custom_components" / "parmair" / "const.py"
-_spec = importlib.util.spec_from_file_location("parmair_const", _const_path)
-_const = importlib.util.module_from_spec(_spec)
-sys.modules["parmair_const"] = _const  # Register module to fix dataclass issues
-_spec.loader.exec_module(_const)
-
 HARDWARE_TYPE_MAP_V2 = _const.HARDWARE_TYPE_MAP_V2
 HEATER_TYPE_ELECTRIC = _const.HEATER_TYPE_ELECTRIC
 HEATER_TYPE_NONE = _const.HEATER_TYPE_NONE
@@ -122,33 +122,65 @@ FILTER_STATE_MAP_V2 = {0: "OK", 1: "Acknowledge Change", 2: "Replace Reminder"}
 SUMMER_MODE_MAP_V2 = {0: "Winter", 1: "Transition", 2: "Summer"}
 
 
+def _state_table(state_map: dict[int, str]) -> tuple[str | None, ...]:
+    """Flatten a small, dense int-keyed state map into a tuple indexed by value."""
+    return tuple(state_map.get(i) for i in range(max(state_map) + 1))
+
+
+# Tuple forms of the maps above (None marks gaps), indexed directly by register value
+_POWER_STATES_V1 = _state_table(POWER_STATE_MAP_V1)
+_POWER_STATES_V2 = _state_table(POWER_STATE_MAP_V2)
+_CONTROL_STATES_V1 = _state_table(CONTROL_STATE_MAP_V1)
+_CONTROL_STATES_V2 = _state_table(CONTROL_STATE_MAP_V2)
+_HEATER_TYPES_V1 = _state_table(HEATER_TYPE_MAP_V1)
+_HEATER_TYPES_V2 = _state_table(HEATER_TYPE_MAP_V2)
+
+# Dense settings labels, indexed by register value
+_SPEED_NAMES = ("Auto", "Stop", "1", "2", "3", "4", "5")
+_FILTER_INTERVALS = ("3 months", "4 months", "6 months")  # V2
+_SUMMER_COOLING_V2 = ("Off", "On", "Auto")
+_BOOST_TIMES = ("30 min", "60 min", "90 min", "120 min", "180 min")
+_OVERP_TIMES = ("15 min", "30 min", "45 min", "60 min", "120 min")
+
+
 # ============================================================================
 # Interpretation Functions
 # ============================================================================
 
 
+def _lookup_state(table: tuple[str | None, ...], value: int | float) -> str:
+    """Return the label for value from a state table, or 'Unknown (value)'."""
+    # Dumps may hold whole-number floats (2.0), which a dict lookup would also match
+    if isinstance(value, float):
+        if not value.is_integer():
+            return f"Unknown ({value})"
+        index = int(value)
+    else:
+        index = value
+    if 0 <= index < len(table) and (label := table[index]) is not None:
+        return label
+    return f"Unknown ({value})"
+
+
 def interpret_power_state(value: int | None, is_v2: bool = False) -> str:
     """Interpret power state register value."""
     if value is None:
         return "Unknown"
-    state_map = POWER_STATE_MAP_V2 if is_v2 else POWER_STATE_MAP_V1
-    return state_map.get(value, f"Unknown ({value})")
+    return _lookup_state(_POWER_STATES_V2 if is_v2 else _POWER_STATES_V1, value)
 
 
 def interpret_control_state(value: int | None, is_v2: bool = False) -> str:
     """Interpret control state register value."""
     if value is None:
         return "Unknown"
-    state_map = CONTROL_STATE_MAP_V2 if is_v2 else CONTROL_STATE_MAP_V1
-    return state_map.get(value, f"Unknown ({value})")
+    return _lookup_state(_CONTROL_STATES_V2 if is_v2 else _CONTROL_STATES_V1, value)
 
 
 def interpret_heater_type(value: int | None, is_v2: bool = False) -> str:
     """Interpret heater type register value."""
     if value is None:
         return "Unknown"
-    heater_map = HEATER_TYPE_MAP_V2 if is_v2 else HEATER_TYPE_MAP_V1
-    return heater_map.get(value, f"Unknown ({value})")
+    return _lookup_state(_HEATER_TYPES_V2 if is_v2 else _HEATER_TYPES_V1, value)
 
 
 def interpret_binary_state(value: int | None, state_map: dict[int, str]) -> str:
@@ -158,12 +190,13 @@ def interpret_binary_state(value: int | None, state_map: dict[int, str]) -> str:
     return state_map.get(value, f"Unknown ({value})")
 
 
+# Raw values that indicate an optional sensor is not installed (65535 = 0xFFFF)
+_UNINSTALLED: frozenset[int] = frozenset({0, -1, 65535})
+
+
 def is_optional_sensor_installed(value: int | None) -> bool:
     """Check if an optional sensor (humidity, CO2) is installed."""
-    if value is None:
-        return False
-    # 0, -1, or 65535 (0xFFFF) indicate sensor not installed
-    return value not in (0, -1, 65535)
+    return value is not None and value not in _UNINSTALLED
 
 
 def format_temperature(value: float | None) -> str:
@@ -197,7 +230,7 @@ def format_filter_date(day: int | None, month: int | None, year: int | None) ->
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class TestResult:
     """Result of a single interpretation test."""
 
@@ -205,7 +238,7 @@ class TestResult:
     name: str
     raw_value: Any
     interpreted: str
-    status: str  # "ok", "warning", "error"
+    status: str = "ok"  # "ok", "warning", "error"
     note: str = ""
 
 
@@ -222,82 +255,93 @@ class InterpretationTester:
         sw_ver = coordinator.data.get("software_version", 0)
         self.is_v2 = sw_ver >= 2.0 if isinstance(sw_ver, int | float) else False
 
+        # Pick the version-specific checks once instead of branching on is_v2 per test
+        if self.is_v2:
+            self._test_mode_states = self._test_mode_states_v2
+            self._test_summer_states = self._test_summer_states_v2
+            self._filter_map = FILTER_STATE_MAP_V2
+        else:
+            self._test_mode_states = self._test_mode_states_v1
+            self._test_summer_states = self._test_summer_states_v1
+            self._filter_map = FILTER_STATE_MAP_V1
+
     def test_all(self) -> list[TestResult]:
         """Run all interpretation tests."""
         self.results = []
 
-        self._test_system_info()
-        self._test_temperatures()
-        self._test_states()
-        self._test_speeds()
-        self._test_optional_sensors()
-        self._test_filter_info()
-        self._test_switch_states()
-        self._test_timers()
+        # Snapshot once; the _test_* helpers read these instead of going back to the coordinator
+        data = self.coord.data
+        get_raw_value = self.coord.get_raw_value
+        raws = {key: get_raw_value(key) for key in self.coord.raw_registers}
+        # Integer views of the numeric values, for the state lookups
+        ints = {key: int(v) for key, v in data.items() if isinstance(v, int | float)}
+
+        self._test_system_info(data, raws, ints)
+        self._test_temperatures(data, raws)
+        self._test_states(raws, ints)
+        self._test_speeds(data, raws)
+        self._test_optional_sensors(data, raws)
+        self._test_filter_info(data, raws, ints)
+        self._test_switch_states(raws, ints)
+        self._test_timers(data, raws)
 
         return self.results
 
-    def _add_result(
+    def _test_system_info(
         self,
-        category: str,
-        name: str,
-        raw_value: Any,
-        interpreted: str,
-        status: str = "ok",
-        note: str = "",
+        data: Mapping[str, Any],
+        raws: Mapping[str, int | None],
+        ints: Mapping[str, int | None],
     ):
-        """Add a test result."""
-        self.results.append(
-            TestResult(
-                category=category,
-                name=name,
-                raw_value=raw_value,
-                interpreted=interpreted,
-                status=status,
-                note=note,
-            )
-        )
-
-    def _test_system_info(self):
         """Test system information interpretation."""
         # Software version
-        sw_ver = self.coord.data.get("software_version")
-        raw = self.coord.get_raw_value("software_version")
+        sw_ver = data.get("software_version")
+        raw = raws.get("software_version")
         if sw_ver is not None:
-            self._add_result("System", "Software Version", raw, f"{sw_ver:.2f}")
+            self.results.append(TestResult("System", "Software Version", raw, f"{sw_ver:.2f}"))
         else:
-            self._add_result("System", "Software Version", raw, "N/A", "warning")
+            self.results.append(TestResult("System", "Software Version", raw, "N/A", "warning"))
 
         # Hardware type
-        hw_type = self.coord.data.get("hardware_type")
-        raw = self.coord.get_raw_value("hardware_type")
+        hw_type = data.get("hardware_type")
+        raw = raws.get("hardware_type")
         if hw_type is not None:
             hw_type_int = int(hw_type)
             # For V2, use mapping if available, otherwise use raw value
             if self.coord.software_version == SOFTWARE_VERSION_2:
                 model_num = HARDWARE_TYPE_MAP_V2.get(hw_type_int, hw_type_int)
                 if model_num != hw_type_int:
-                    self._add_result(
-                        "System", "Hardware Type", raw, f"MAC {model_num} (type code {hw_type_int})"
+                    self.results.append(
+                        TestResult(
+                            "System",
+                            "Hardware Type",
+                            raw,
+                            f"MAC {model_num} (type code {hw_type_int})",
+                        )
                     )
                 else:
-                    self._add_result("System", "Hardware Type", raw, f"MAC {hw_type_int}")
+                    self.results.append(
+                        TestResult("System", "Hardware Type", raw, f"MAC {hw_type_int}")
+                    )
             else:
-                self._add_result("System", "Hardware Type", raw, f"MAC {hw_type_int}")
+                self.results.append(
+                    TestResult("System", "Hardware Type", raw, f"MAC {hw_type_int}")
+                )
         else:
-            self._add_result("System", "Hardware Type", raw, "N/A", "warning")
+            self.results.append(TestResult("System", "Hardware Type", raw, "N/A", "warning"))
 
         # Heater type
-        heater = self.coord.data.get("heater_type")
-        raw = self.coord.get_raw_value("heater_type")
-        self._add_result(
-            "System",
-            "Heater Type",
-            raw,
-            interpret_heater_type(int(heater) if heater is not None else None, self.is_v2),
+        raw = raws.get("heater_type")
+        self.results.append(
+            TestResult(
+                "System",
+                "Heater Type",
+                raw,
+                interpret_heater_type(ints.get("heater_type"), self.is_v2),
+            )
         )
 
-    def _test_temperatures(self):
+    def _test_temperatures(self, data: Mapping[str, Any], raws: Mapping[str, int | None]):
         """Test temperature interpretation."""
         temp_keys = [
             ("fresh_air_temp", "Fresh Air"),
@@ -310,8 +354,8 @@ class InterpretationTester:
         ]
 
         for key, name in temp_keys:
-            value = self.coord.data.get(key)
-            raw = self.coord.get_raw_value(key)
+            value = data.get(key)
+            raw = raws.get(key)
 
             # Check for reasonable temperature range
             status = "ok"
@@ -320,114 +364,138 @@ class InterpretationTester:
                 status = "warning"
                 note = "Unusual temperature"
 
-            self._add_result(
-                "Temperature",
-                name,
-                raw,
-                format_temperature(value),
-                status,
-                note,
+            self.results.append(
+                TestResult(
+                    "Temperature",
+                    name,
+                    raw,
+                    format_temperature(value),
+                    status,
+                    note,
+                )
             )
 
-    def _test_states(self):
+    def _test_states(
+        self,
+        raws: Mapping[str, int | None],
+        ints: Mapping[str, int | None],
+    ):
         """Test state interpretation."""
         # Power state
-        power = self.coord.data.get("power")
-        raw = self.coord.get_raw_value("power")
-        self._add_result(
-            "State",
-            "Power",
-            raw,
-            interpret_power_state(int(power) if power is not None else None, self.is_v2),
+        raw = raws.get("power")
+        self.results.append(
+            TestResult(
+                "State",
+                "Power",
+                raw,
+                interpret_power_state(ints.get("power"), self.is_v2),
+            )
         )
 
         # Control state
-        control = self.coord.data.get("control_state")
-        raw = self.coord.get_raw_value("control_state")
-        self._add_result(
-            "State",
-            "Control",
-            raw,
-            interpret_control_state(int(control) if control is not None else None, self.is_v2),
+        raw = raws.get("control_state")
+        self.results.append(
+            TestResult(
+                "State",
+                "Control",
+                raw,
+                interpret_control_state(ints.get("control_state"), self.is_v2),
+            )
         )
 
-        # Home/Away state - V2 derives from control_state
-        if self.is_v2:
-            # V2: derive from USERSTATECONTROL_FO (2=Home, 1=Away)
-            home_val = "Home" if control == 2 else ("Away" if control == 1 else f"Mode {control}")
-            self._add_result("State", "Home/Away", raw, home_val)
+        self._test_mode_states(raws, ints)
+
+        # Defrost state
+        raw = raws.get("defrost_state")
+        self.results.append(
+            TestResult(
+                "State",
+                "Defrost",
+                raw,
+                interpret_binary_state(ints.get("defrost_state"), BINARY_STATE_MAP),
+            )
+        )
+
+    def _test_mode_states_v2(
+        self,
+        raws: Mapping[str, int | None],
+        ints: Mapping[str, int | None],
+    ):
+        """Test home/boost/special mode states, derived from control_state on V2."""
+        raw = raws.get("control_state")
+        control = ints.get("control_state")
+
+        # V2: derive from USERSTATECONTROL_FO (2=Home, 1=Away)
+        home_val = "Home" if control == 2 else ("Away" if control == 1 else f"Mode {control}")
+        self.results.append(TestResult("State", "Home/Away", raw, home_val))
+
+        boost_val = "On" if control == 3 else "Off"
+        self.results.append(TestResult("State", "Boost", control, boost_val))
+
+        # V2 has Sauna/Fireplace modes instead of an overpressure state
+        if control == 4:
+            mode_val = "Sauna Active"
+        elif control == 5:
+            mode_val = "Fireplace Active"
         else:
-            home = self.coord.data.get("home_state")
-            raw = self.coord.get_raw_value("home_state")
-            self._add_result(
+            mode_val = "Off"
+        self.results.append(TestResult("State", "Special Mode", control, mode_val))
+
+    def _test_mode_states_v1(
+        self,
+        raws: Mapping[str, int | None],
+        ints: Mapping[str, int | None],
+    ):
+        """Test home/boost/overpressure states from their own V1 registers."""
+        raw = raws.get("home_state")
+        self.results.append(
+            TestResult(
                 "State",
                 "Home/Away",
                 raw,
-                interpret_binary_state(int(home) if home is not None else None, HOME_STATE_MAP),
+                interpret_binary_state(ints.get("home_state"), HOME_STATE_MAP),
             )
+        )
 
-        # Boost state - V2 derives from control_state
-        if self.is_v2:
-            boost_val = "On" if control == 3 else "Off"
-            self._add_result("State", "Boost", control, boost_val)
-        else:
-            boost = self.coord.data.get("boost_state")
-            raw = self.coord.get_raw_value("boost_state")
-            self._add_result(
+        raw = raws.get("boost_state")
+        self.results.append(
+            TestResult(
                 "State",
                 "Boost",
                 raw,
-                interpret_binary_state(int(boost) if boost is not None else None, BINARY_STATE_MAP),
+                interpret_binary_state(ints.get("boost_state"), BINARY_STATE_MAP),
             )
+        )
 
-        # Overpressure/Sauna/Fireplace state - V2 has different modes
-        if self.is_v2:
-            if control == 4:
-                mode_val = "Sauna Active"
-            elif control == 5:
-                mode_val = "Fireplace Active"
-            else:
-                mode_val = "Off"
-            self._add_result("State", "Special Mode", control, mode_val)
-        else:
-            overp = self.coord.data.get("overpressure_state")
-            raw = self.coord.get_raw_value("overpressure_state")
-            self._add_result(
+        raw = raws.get("overpressure_state")
+        self.results.append(
+            TestResult(
                 "State",
                 "Overpressure",
                 raw,
-                interpret_binary_state(int(overp) if overp is not None else None, BINARY_STATE_MAP),
+                interpret_binary_state(ints.get("overpressure_state"), BINARY_STATE_MAP),
             )
-
-        # Defrost state
-        defrost = self.coord.data.get("defrost_state")
-        raw = self.coord.get_raw_value("defrost_state")
-        self._add_result(
-            "State",
-            "Defrost",
-            raw,
-            interpret_binary_state(int(defrost) if defrost is not None else None, BINARY_STATE_MAP),
         )
 
-    def _test_speeds(self):
+    def _test_speeds(self, data: Mapping[str, Any], raws: Mapping[str, int | None]):
         """Test speed-related values."""
         # Current speed
-        speed = self.coord.data.get("actual_speed")
-        raw = self.coord.get_raw_value("actual_speed")
+        speed = data.get("actual_speed")
+        raw = raws.get("actual_speed")
         if speed is not None:
-            self._add_result("Speed", "Current Speed", raw, f"Speed {int(speed)}")
+            self.results.append(TestResult("Speed", "Current Speed", raw, f"Speed {int(speed)}"))
         else:
-            self._add_result("Speed", "Current Speed", raw, "N/A", "warning")
+            self.results.append(TestResult("Speed", "Current Speed", raw, "N/A", "warning"))
 
         # Speed control
-        speed_ctrl = self.coord.data.get("speed_control")
-        raw = self.coord.get_raw_value("speed_control")
+        speed_ctrl = data.get("speed_control")
+        raw = raws.get("speed_control")
         if speed_ctrl is not None:
-            speed_names = {0: "Auto", 1: "Stop", 2: "1", 3: "2", 4: "3", 5: "4", 6: "5"}
-            name = speed_names.get(int(speed_ctrl), f"Unknown ({speed_ctrl})")
-            self._add_result("Speed", "Speed Control", raw, name)
+            i = int(speed_ctrl)
+            name = _SPEED_NAMES[i] if 0 <= i < len(_SPEED_NAMES) else f"Unknown ({speed_ctrl})"
+            self.results.append(TestResult("Speed", "Speed Control", raw, name))
         else:
-            self._add_result("Speed", "Speed Control", raw, "N/A")
+            self.results.append(TestResult("Speed", "Speed Control", raw, "N/A"))
 
         # Preset speeds
         for key, name in [
@@ -435,145 +503,139 @@ class InterpretationTester:
             ("away_speed", "Away Preset"),
             ("boost_setting", "Boost Preset"),
         ]:
-            value = self.coord.data.get(key)
-            raw = self.coord.get_raw_value(key)
+            value = data.get(key)
+            raw = raws.get(key)
             if value is not None:
-                self._add_result("Speed", name, raw, f"Speed {int(value)}")
+                self.results.append(TestResult("Speed", name, raw, f"Speed {int(value)}"))
             else:
-                self._add_result("Speed", name, raw, "N/A")
+                self.results.append(TestResult("Speed", name, raw, "N/A"))
 
         # Fan speeds (percentage)
         for key, name in [
             ("supply_fan_speed", "Supply Fan"),
             ("exhaust_fan_speed", "Exhaust Fan"),
         ]:
-            value = self.coord.data.get(key)
-            raw = self.coord.get_raw_value(key)
-            self._add_result("Speed", name, raw, format_percentage(value))
+            value = data.get(key)
+            raw = raws.get(key)
+            self.results.append(TestResult("Speed", name, raw, format_percentage(value)))
 
         # Pre-/post-heaters (percentage)
         for key, name in [
             ("pre_heater_output", "Pre-heater Output"),
             ("post_heater_output", "Post-heater Output"),
         ]:
-            value = self.coord.data.get(key)
-            raw = self.coord.get_raw_value(key)
-            self._add_result("Performance", name, raw, format_percentage(value))
+            value = data.get(key)
+            raw = raws.get(key)
+            self.results.append(TestResult("Performance", name, raw, format_percentage(value)))
 
         # Heat recovery efficiency
-        efficiency = self.coord.data.get("heat_recovery_efficiency")
-        raw = self.coord.get_raw_value("heat_recovery_efficiency")
-        self._add_result("Performance", "Heat Recovery", raw, format_percentage(efficiency))
+        efficiency = data.get("heat_recovery_efficiency")
+        raw = raws.get("heat_recovery_efficiency")
+        self.results.append(
+            TestResult("Performance", "Heat Recovery", raw, format_percentage(efficiency))
+        )
 
-    def _test_optional_sensors(self):
+    def _test_optional_sensors(self, data: Mapping[str, Any], raws: Mapping[str, int | None]):
         """Test optional sensor interpretation."""
         # Humidity
-        humidity = self.coord.data.get("humidity")
-        raw = self.coord.get_raw_value("humidity")
+        humidity = data.get("humidity")
+        raw = raws.get("humidity")
         if is_optional_sensor_installed(raw):
-            self._add_result("Optional", "Humidity", raw, f"{humidity}%")
+            self.results.append(TestResult("Optional", "Humidity", raw, f"{humidity}%"))
         else:
-            self._add_result("Optional", "Humidity", raw, "Not installed", "ok", "Sensor absent")
+            self.results.append(
+                TestResult("Optional", "Humidity", raw, "Not installed", "ok", "Sensor absent")
+            )
 
         # Humidity 24h average
-        humidity_avg = self.coord.data.get("humidity_24h_avg")
-        raw = self.coord.get_raw_value("humidity_24h_avg")
+        humidity_avg = data.get("humidity_24h_avg")
+        raw = raws.get("humidity_24h_avg")
         if humidity_avg is not None and humidity_avg >= 0:
-            self._add_result("Optional", "Humidity 24h Avg", raw, f"{humidity_avg:.1f}%")
+            self.results.append(
+                TestResult("Optional", "Humidity 24h Avg", raw, f"{humidity_avg:.1f}%")
+            )
         else:
-            self._add_result("Optional", "Humidity 24h Avg", raw, "Not available", "ok")
+            self.results.append(
+                TestResult("Optional", "Humidity 24h Avg", raw, "Not available", "ok")
+            )
 
         # CO2
-        co2 = self.coord.data.get("co2")
-        raw = self.coord.get_raw_value("co2")
+        co2 = data.get("co2")
+        raw = raws.get("co2")
         if is_optional_sensor_installed(raw):
-            self._add_result("Optional", "CO2", raw, f"{co2} ppm")
+            self.results.append(TestResult("Optional", "CO2", raw, f"{co2} ppm"))
         else:
-            self._add_result("Optional", "CO2", raw, "Not installed", "ok", "Sensor absent")
+            self.results.append(
+                TestResult("Optional", "CO2", raw, "Not installed", "ok", "Sensor absent")
+            )
 
-    def _test_filter_info(self):
+    def _test_filter_info(
+        self,
+        data: Mapping[str, Any],
+        raws: Mapping[str, int | None],
+        ints: Mapping[str, int | None],
+    ):
         """Test filter information."""
         # Filter state - V2 uses different values
-        filter_state = self.coord.data.get("filter_state")
-        raw = self.coord.get_raw_value("filter_state")
-        filter_map = FILTER_STATE_MAP_V2 if self.is_v2 else FILTER_STATE_MAP_V1
-        self._add_result(
-            "Filter",
-            "Status",
-            raw,
-            interpret_binary_state(
-                int(filter_state) if filter_state is not None else None,
-                filter_map,
-            ),
+        raw = raws.get("filter_state")
+        self.results.append(
+            TestResult(
+                "Filter",
+                "Status",
+                raw,
+                interpret_binary_state(
+                    ints.get("filter_state"),
+                    self._filter_map,
+                ),
+            )
         )
 
         # Filter change date
-        day = self.coord.data.get("filter_day")
-        month = self.coord.data.get("filter_month")
-        year = self.coord.data.get("filter_year")
-        self._add_result(
-            "Filter",
-            "Last Changed",
-            f"{day}/{month}/{year}",
-            format_filter_date(day, month, year),
+        day = data.get("filter_day")
+        month = data.get("filter_month")
+        year = data.get("filter_year")
+        self.results.append(
+            TestResult(
+                "Filter",
+                "Last Changed",
+                (day, month, year),
+                format_filter_date(day, month, year),
+            )
         )
 
         # Next filter change
-        next_day = self.coord.data.get("filter_next_day")
-        next_month = self.coord.data.get("filter_next_month")
-        next_year = self.coord.data.get("filter_next_year")
-        self._add_result(
-            "Filter",
-            "Next Change",
-            f"{next_day}/{next_month}/{next_year}",
-            format_filter_date(next_day, next_month, next_year),
+        next_day = data.get("filter_next_day")
+        next_month = data.get("filter_next_month")
+        next_year = data.get("filter_next_year")
+        self.results.append(
+            TestResult(
+                "Filter",
+                "Next Change",
+                (next_day, next_month, next_year),
+                format_filter_date(next_day, next_month, next_year),
+            )
         )
 
         # Filter interval
         # V2: 0=3 months, 1=4 months, 2=6 months
-        interval = self.coord.data.get("filter_interval")
-        raw = self.coord.get_raw_value("filter_interval")
+        interval = data.get("filter_interval")
+        raw = raws.get("filter_interval")
         if interval is not None:
-            interval_map = {0: "3 months", 1: "4 months", 2: "6 months"}
-            interval_str = interval_map.get(int(interval), f"{int(interval)} (unknown)")
-            self._add_result("Filter", "Interval", raw, interval_str)
+            i = int(interval)
+            interval_str = (
+                _FILTER_INTERVALS[i] if 0 <= i < len(_FILTER_INTERVALS) else f"{i} (unknown)"
+            )
+            self.results.append(TestResult("Filter", "Interval", raw, interval_str))
         else:
-            self._add_result("Filter", "Interval", raw, "N/A")
+            self.results.append(TestResult("Filter", "Interval", raw, "N/A"))
 
-    def _test_switch_states(self):
+    def _test_switch_states(
+        self,
+        raws: Mapping[str, int | None],
+        ints: Mapping[str, int | None],
+    ):
         """Test switch state interpretation."""
-        # V2: Season is a separate read-only indicator (season_state)
-        # V2: Summer mode setting (summer_mode) is auto summer cooling enable
-        if self.is_v2:
-            # Actual season indicator
-            season = self.coord.data.get("season_state")
-            raw = self.coord.get_raw_value("season_state")
-            if season is not None:
-                season_val = SUMMER_MODE_MAP_V2.get(int(season), f"Unknown ({season})")
-                self._add_result("State", "Season", raw, season_val)
-            else:
-                self._add_result("State", "Season", raw, "N/A (register not read)")
-
-            # Summer cooling setting (0=Off, 1=On, 2=Auto?)
-            summer = self.coord.data.get("summer_mode")
-            raw = self.coord.get_raw_value("summer_mode")
-            summer_cooling_map = {0: "Off", 1: "On", 2: "Auto"}
-            summer_val = summer_cooling_map.get(
-                int(summer) if summer is not None else None, f"Unknown ({summer})"
-            )
-            self._add_result("Switch", "Summer Cooling", raw, summer_val)
-        else:
-            # V1: summer_mode is just on/off
-            summer = self.coord.data.get("summer_mode")
-            raw = self.coord.get_raw_value("summer_mode")
-            self._add_result(
-                "Switch",
-                "Summer Mode",
-                raw,
-                interpret_binary_state(
-                    int(summer) if summer is not None else None, BINARY_STATE_MAP
-                ),
-            )
+        self._test_summer_states(raws, ints)
 
         # Other switches
         switches = [
@@ -582,16 +644,58 @@ class InterpretationTester:
         ]
 
         for key, name in switches:
-            value = self.coord.data.get(key)
-            raw = self.coord.get_raw_value(key)
-            self._add_result(
+            raw = raws.get(key)
+            self.results.append(
+                TestResult(
+                    "Switch",
+                    name,
+                    raw,
+                    interpret_binary_state(ints.get(key), BINARY_STATE_MAP),
+                )
+            )
+
+    def _test_summer_states_v2(
+        self,
+        raws: Mapping[str, int | None],
+        ints: Mapping[str, int | None],
+    ):
+        """Test season and summer cooling on V2."""
+        # V2: Season is a separate read-only indicator (season_state)
+        season = ints.get("season_state")
+        raw = raws.get("season_state")
+        if season is not None:
+            season_val = SUMMER_MODE_MAP_V2.get(season, f"Unknown ({season})")
+            self.results.append(TestResult("State", "Season", raw, season_val))
+        else:
+            self.results.append(TestResult("State", "Season", raw, "N/A (register not read)"))
+
+        # V2: Summer mode setting (summer_mode) is auto summer cooling enable (0=Off, 1=On, 2=Auto?)
+        summer = ints.get("summer_mode")
+        raw = raws.get("summer_mode")
+        summer_val = (
+            _SUMMER_COOLING_V2[summer]
+            if summer is not None and 0 <= summer < len(_SUMMER_COOLING_V2)
+            else f"Unknown ({summer})"
+        )
+        self.results.append(TestResult("Switch", "Summer Cooling", raw, summer_val))
+
+    def _test_summer_states_v1(
+        self,
+        raws: Mapping[str, int | None],
+        ints: Mapping[str, int | None],
+    ):
+        """Test summer mode on V1, where it is just on/off."""
+        raw = raws.get("summer_mode")
+        self.results.append(
+            TestResult(
                 "Switch",
-                name,
+                "Summer Mode",
                 raw,
-                interpret_binary_state(int(value) if value is not None else None, BINARY_STATE_MAP),
+                interpret_binary_state(ints.get("summer_mode"), BINARY_STATE_MAP),
             )
+        )
 
-    def _test_timers(self):
+    def _test_timers(self, data: Mapping[str, Any], raws: Mapping[str, int | None]):
         """Test timer values."""
         timers = [
             ("boost_timer", "Boost Timer"),
@@ -599,84 +703,91 @@ class InterpretationTester:
         ]
 
         for key, name in timers:
-            value = self.coord.data.get(key)
-            raw = self.coord.get_raw_value(key)
+            value = data.get(key)
+            raw = raws.get(key)
             if value is not None and value > 0:
-                self._add_result("Timer", name, raw, f"{int(value)} min")
+                self.results.append(TestResult("Timer", name, raw, f"{int(value)} min"))
             else:
-                self._add_result("Timer", name, raw, "Inactive")
+                self.results.append(TestResult("Timer", name, raw, "Inactive"))
 
         # Preset durations
-        boost_time = self.coord.data.get("boost_time_setting")
-        raw = self.coord.get_raw_value("boost_time_setting")
-        boost_time_map = {0: "30 min", 1: "60 min", 2: "90 min", 3: "120 min", 4: "180 min"}
+        boost_time = data.get("boost_time_setting")
+        raw = raws.get("boost_time_setting")
         if boost_time is not None:
-            self._add_result(
-                "Timer",
-                "Boost Preset",
-                raw,
-                boost_time_map.get(int(boost_time), f"Unknown ({boost_time})"),
+            i = int(boost_time)
+            self.results.append(
+                TestResult(
+                    "Timer",
+                    "Boost Preset",
+                    raw,
+                    _BOOST_TIMES[i] if 0 <= i < len(_BOOST_TIMES) else f"Unknown ({boost_time})",
+                )
             )
         else:
-            self._add_result("Timer", "Boost Preset", raw, "N/A")
+            self.results.append(TestResult("Timer", "Boost Preset", raw, "N/A"))
 
-        overp_time = self.coord.data.get("overpressure_time_setting")
-        raw = self.coord.get_raw_value("overpressure_time_setting")
-        overp_time_map = {0: "15 min", 1: "30 min", 2: "45 min", 3: "60 min", 4: "120 min"}
+        overp_time = data.get("overpressure_time_setting")
+        raw = raws.get("overpressure_time_setting")
         if overp_time is not None:
-            self._add_result(
-                "Timer",
-                "Overpressure Preset",
-                raw,
-                overp_time_map.get(int(overp_time), f"Unknown ({overp_time})"),
+            i = int(overp_time)
+            self.results.append(
+                TestResult(
+                    "Timer",
+                    "Overpressure Preset",
+                    raw,
+                    _OVERP_TIMES[i] if 0 <= i < len(_OVERP_TIMES) else f"Unknown ({overp_time})",
+                )
             )
         else:
-            self._add_result("Timer", "Overpressure Preset", raw, "N/A")
+            self.results.append(TestResult("Timer", "Overpressure Preset", raw, "N/A"))
+
 
+# Status -> indicator shown in front of each result ("ok" and anything unknown -> ✓)
+_INDICATORS = {"ok": "✓", "warning": "⚠", "error": "✗"}
 
-def print_results(results: list[TestResult], verbose: bool = False):
+
+def print_results(results: Iterable[TestResult], verbose: bool = False):
     """Print test results in a readable format."""
-    # Group by category
-    categories: dict[str, list[TestResult]] = {}
+    # Group by category and count statuses in a single pass, so results may be any iterable
+    categories: defaultdict[str, list[TestResult]] = defaultdict(list)
+    total = warnings = errors = 0
     for r in results:
-        if r.category not in categories:
-            categories[r.category] = []
         categories[r.category].append(r)
+        total += 1
+        if r.status == "warning":
+            warnings += 1
+        elif r.status == "error":
+            errors += 1
 
-    warnings = 0
-    errors = 0
-
+    lines: list[str] = []
     for category, items in categories.items():
-        print(f"\n{category.upper()}")
-        print("-" * 40)
+        lines.append(f"\n{category.upper()}")
+        lines.append("-" * 40)
 
         for item in items:
-            # Status indicator
-            if item.status == "warning":
-                indicator = "⚠"
-                warnings += 1
-            elif item.status == "error":
-                indicator = "✗"
-                errors += 1
-            else:
-                indicator = "✓"
-
             # Format output
-            raw_str = f"(raw: {item.raw_value})" if verbose else ""
+            indicator = _INDICATORS.get(item.status, "✓")
+            raw_str = ""
+            if verbose:
+                raw = item.raw_value
+                # Dates are kept as (day, month, year) and only formatted when shown
+                raw_str = f"(raw: {'/'.join(map(str, raw)) if isinstance(raw, tuple) else raw})"
             note_str = f" [{item.note}]" if item.note else ""
 
-            print(f"  {indicator} {item.name:25} {item.interpreted:20} {raw_str}{note_str}")
+            lines.append(f"  {indicator} {item.name:25} {item.interpreted:20} {raw_str}{note_str}")
 
     # Summary
-    print("\n" + "=" * 50)
-    total = len(results)
+    lines.append("\n" + "=" * 50)
     ok = total - warnings - errors
-    print(f"SUMMARY: {ok}/{total} OK", end="")
+    summary = f"SUMMARY: {ok}/{total} OK"
     if warnings:
-        print(f", {warnings} warnings", end="")
+        summary += f", {warnings} warnings"
     if errors:
-        print(f", {errors} errors", end="")
-    print()
+        summary += f", {errors} errors"
+    lines.append(summary)
+
+    # One write per file rather than one print per result
+    sys.stdout.write("\n".join(lines) + "\n")
 
     return errors == 0
 
@@ -721,29 +832,55 @@ def test_file(filepath: Path, verbose: bool = False) -> bool:
     return print_results(results, verbose=verbose)
 
 
-def test_all_fixtures(verbose: bool = False) -> bool:
-    """Test all fixture files."""
+def _find_json_files(directory: Path) -> list[Path]:
+    """Return the *.json files directly in directory, sorted by name (none if it is missing)."""
+    try:
+        with os.scandir(directory) as entries:
+            names = sorted(
+                entry.name for entry in entries if entry.name.endswith(".json") and entry.is_file()
+            )
+    except FileNotFoundError:
+        return []
+    return [directory / name for name in names]
+
+
+def _run_one_fixture(filepath: Path, verbose: bool) -> tuple[bool, str]:
+    """Test one file with its report captured; run in worker processes by --all."""
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        passed = test_file(filepath, verbose)
+    return passed, buffer.getvalue()
+
+
+def test_all_fixtures(verbose: bool = False, jobs: int | None = None) -> bool:
+    """Test all fixture files.
+
+    Files are independent, so with more than one file they are tested in up to
+    jobs worker processes (default: one per CPU). Reports are printed in file order.
+    """
     fixtures_dir = Path(__file__).parent / "test_fixtures"
     dumps_dir = Path(__file__).parent / "dumps"
 
-    all_passed = True
-    files_tested = 0
-
-    # Test fixtures
-    if fixtures_dir.exists():
-        for filepath in sorted(fixtures_dir.glob("*.json")):
-            if not test_file(filepath, verbose):
-                all_passed = False
-            files_tested += 1
-            print()
+    # Test fixtures, then any dumps
+    filepaths = [*_find_json_files(fixtures_dir), *_find_json_files(dumps_dir)]
+    files_tested = len(filepaths)
+    jobs = min(jobs or os.cpu_count() or 1, files_tested)
 
-    # Also test any dumps
-    if dumps_dir.exists():
-        for filepath in sorted(dumps_dir.glob("*.json")):
+    all_passed = True
+    if jobs <= 1:
+        for filepath in filepaths:
             if not test_file(filepath, verbose):
                 all_passed = False
-            files_tested += 1
             print()
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            for passed, report in executor.map(
+                _run_one_fixture, filepaths, itertools.repeat(verbose)
+            ):
+                sys.stdout.write(report)
+                if not passed:
+                    all_passed = False
+                print()
 
     if files_tested == 0:
         print("No test files found in test_fixtures/ or dumps/")
@@ -787,11 +924,17 @@ Examples:
         action="store_true",
         help="Show raw register values",
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        help="Worker processes for --all (default: one per CPU)",
+    )
 
     args = parser.parse_args()
 
     if args.all:
-        success = test_all_fixtures(args.verbose)
+        success = test_all_fixtures(args.verbose, args.jobs)
     elif args.file:
         success = test_file(args.file, args.verbose)
     else: